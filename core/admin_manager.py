@@ -4,12 +4,20 @@
 该模块负责管理机器人的管理员列表。
 它实现了文件和 Redis 缓存之间的数据同步，并提供了一套清晰的 API
 供其他模块调用。
+
+管理员查询直接读取本地的 frozenset；修改管理员后会通过 Redis 发布
+变更通知，其他进程收到通知后从 Redis 刷新本地集合。文件写入由后台
+任务合并延迟执行，不占用指令处理的时间。
 """
-import json
+import asyncio
 import os
-from typing import Set
+from typing import FrozenSet, List, Optional
+
+import orjson
 
+from .executor import run_in_thread_pool
 from .logger import logger
+from .redis_manager import redis_manager
 
 
 class AdminManager:
@@ -21,6 +29,10 @@ class AdminManager:
     """
     _instance = None
     _REDIS_KEY = "neobot:admins"  # 用于存储管理员集合的 Redis 键
+    _CHANNEL = "neobot:admins:changed"  # 管理员变更通知频道
+    _SAVE_DELAY = 0.5  # 合并写盘的等待时间（秒）
+    _RESUBSCRIBE_MIN_DELAY = 1  # 变更订阅中断后首次重试的等待时间（秒）
+    _RESUBSCRIBE_MAX_DELAY = 60  # 变更订阅重试的最长等待时间（秒）
 
     def __new__(cls):
         """
@@ -46,7 +58,13 @@ class AdminManager:
             "admin.json"
         )
         
-        self._admins: Set[int] = set()
+        self._admins: FrozenSet[int] = frozenset()
+        self._mutations = 0  # 本地修改计数，用于丢弃过期的 Redis 刷新结果
+        self._revision = 0  # 管理员集合每次被替换时递增，供其他模块判断缓存是否过期
+        self._rendered_cache: Optional[str] = None  # 渲染好的管理员列表文本，集合被替换时清空
+        self._save_task: Optional[asyncio.Task] = None
+        self._dirty = False  # 是否有尚未写入 admin.json 的修改
+        self._listener_task: Optional[asyncio.Task] = None
         self._initialized = True
         logger.info("管理员管理器初始化完成")
 
@@ -56,81 +74,193 @@ class AdminManager:
         """
         await self._load_from_file()
         await self._sync_to_redis()
+        if self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen_changes())
         logger.info("管理员数据加载并同步到 Redis 完成")
 
+    async def close(self):
+        """
+        停止后台任务，并立即保存尚未写盘的修改
+        """
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            self._listener_task = None
+        if self._save_task is not None and not self._save_task.done():
+            # 不取消写盘任务，避免线程池中的写入与新的写入交错
+            await self._save_task
+
     async def _load_from_file(self):
         """
         从 admin.json 加载管理员列表
         """
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    admins = data.get("admins", [])
-                    self._admins = set(int(admin_id) for admin_id in admins)
-                    logger.debug(f"从 {self.data_file} 加载了 {len(self._admins)} 位管理员")
-            else:
-                # 如果文件不存在，创建一个空的
-                self._admins = set()
-                await self._save_to_file()
-        except (json.JSONDecodeError, ValueError) as e:
+            with open(self.data_file, "rb") as f:
+                data = orjson.loads(f.read())
+            admins = data.get("admins", [])
+            self._set_admins(frozenset(int(admin_id) for admin_id in admins))
+            logger.debug(f"从 {self.data_file} 加载了 {len(self._admins)} 位管理员")
+        except FileNotFoundError:
+            # 如果文件不存在，创建一个空的
+            self._set_admins(frozenset())
+            await self._save_to_file()
+        except ValueError as e:
+            # orjson.JSONDecodeError 是 ValueError 的子类
             logger.error(f"加载或解析 admin.json 失败: {e}")
-            self._admins = set()
+            self._set_admins(frozenset())
 
     async def _save_to_file(self):
         """
         将当前管理员列表保存回 admin.json
         """
         try:
-            # 确保目录存在
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
             # 将 set 转换为 list 以便 JSON 序列化
             admin_list = [str(admin_id) for admin_id in self._admins]
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump({"admins": admin_list}, f, indent=2, ensure_ascii=False)
+            payload = orjson.dumps({"admins": admin_list}, option=orjson.OPT_INDENT_2)
+            await run_in_thread_pool(self._write_file, payload)
             logger.debug(f"管理员列表已保存到 {self.data_file}")
         except Exception as e:
             logger.error(f"保存 admin.json 失败: {e}")
 
+    def _write_file(self, payload: bytes):
+        """
+        一次性写入临时文件，再原子替换 admin.json（在线程池中执行）
+        """
+        # 确保目录存在
+        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+        tmp_file = self.data_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_file, self.data_file)
+
+    def _schedule_save(self):
+        """
+        安排一次延迟写盘
+
+        等待期间的多次修改会合并为一次文件写入。
+        """
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._delayed_save())
+
+    async def _delayed_save(self):
+        """
+        等待合并窗口结束后写入 admin.json
+
+        写盘期间发生的修改会重新标记为未保存，循环直到没有未保存的修改，
+        避免这些修改因写盘任务尚未结束而被遗漏。
+        """
+        while self._dirty:
+            await asyncio.sleep(self._SAVE_DELAY)
+            self._dirty = False
+            await self._save_to_file()
+
+    async def _listen_changes(self):
+        """
+        订阅管理员变更通知，收到通知后从 Redis 刷新本地集合
+
+        订阅因异常中断时按指数退避重新订阅；重新订阅成功后主动刷新一次，
+        补上断线期间错过的变更。
+        """
+        delay = self._RESUBSCRIBE_MIN_DELAY
+        resubscribing = False
+        while True:
+            try:
+                pubsub = redis_manager.pubsub()
+                try:
+                    await pubsub.subscribe(self._CHANNEL)
+                    if resubscribing:
+                        await self._refresh_from_redis()
+                        logger.info("管理员变更订阅已恢复")
+                    delay = self._RESUBSCRIBE_MIN_DELAY
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            await self._refresh_from_redis()
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"管理员变更订阅异常: {e}，{delay} 秒后重新订阅")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._RESUBSCRIBE_MAX_DELAY)
+            resubscribing = True
+
+    async def _refresh_from_redis(self):
+        """
+        从 Redis 读取管理员集合并替换本地集合
+        """
+        mutations = self._mutations
+        try:
+            members = await redis_manager.redis.smembers(self._REDIS_KEY)
+            if mutations != self._mutations:
+                # 读取期间本地又有修改，以本地为准，等待该修改自身的通知
+                return
+            self._set_admins(frozenset(int(admin_id) for admin_id in members))
+            logger.debug(f"已从 Redis 刷新管理员列表，共 {len(self._admins)} 位")
+        except Exception as e:
+            logger.error(f"从 Redis 刷新管理员列表失败: {e}")
+
     async def _sync_to_redis(self):
         """
         将内存中的管理员集合同步到 Redis
         """
-        from .redis_manager import redis_manager
         try:
-            # 首先清空旧的集合
-            await redis_manager.redis.delete(self._REDIS_KEY)
-            if self._admins:
-                # 将所有管理员ID添加到集合中
-                await redis_manager.redis.sadd(self._REDIS_KEY, *self._admins)
+            # 在同一个事务中清空并重建集合，避免其他进程读到空集合
+            async with redis_manager.redis.pipeline(transaction=True) as pipe:
+                pipe.delete(self._REDIS_KEY)
+                if self._admins:
+                    # 将所有管理员ID添加到集合中
+                    pipe.sadd(self._REDIS_KEY, *self._admins)
+                await pipe.execute()
             logger.debug(f"已将 {len(self._admins)} 位管理员同步到 Redis")
         except Exception as e:
             logger.error(f"同步管理员到 Redis 失败: {e}")
 
+    @property
+    def revision(self) -> int:
+        """
+        管理员集合的版本号，集合发生变化时递增
+        """
+        return self._revision
+
+    def _set_admins(self, admins: FrozenSet[int]):
+        """
+        替换本地管理员集合，递增版本号并清空列表文本缓存
+        """
+        self._admins = admins
+        self._revision += 1
+        self._rendered_cache = None
+
     async def is_admin(self, user_id: int) -> bool:
         """
-        检查用户是否为管理员（从 Redis 缓存读取）
+        检查用户是否为管理员（读取本地集合，不访问 Redis）
         """
-        from .redis_manager import redis_manager
-        try:
-            return await redis_manager.redis.sismember(self._REDIS_KEY, user_id)
-        except Exception as e:
-            logger.error(f"从 Redis 检查管理员权限失败: {e}")
-            # Redis 失败时，回退到内存检查
-            return user_id in self._admins
+        return user_id in self._admins
+
+    async def are_admins(self, user_ids: List[int]) -> List[bool]:
+        """
+        批量检查多个用户是否为管理员
+
+        与 `is_admin` 一样直接查询本地集合，结果与 user_ids 顺序一一对应。
+        """
+        admins = self._admins
+        return [user_id in admins for user_id in user_ids]
 
     async def add_admin(self, user_id: int) -> bool:
         """
         添加管理员，并同步到文件和 Redis
         """
-        from .redis_manager import redis_manager
         if user_id in self._admins:
             return False  # 用户已经是管理员
 
-        self._admins.add(user_id)
-        await self._save_to_file()
+        self._set_admins(self._admins | {user_id})
+        self._mutations += 1
+        self._schedule_save()
         try:
-            await redis_manager.redis.sadd(self._REDIS_KEY, user_id)
+            async with redis_manager.redis.pipeline(transaction=False) as pipe:
+                pipe.sadd(self._REDIS_KEY, user_id)
+                pipe.publish(self._CHANNEL, user_id)
+                await pipe.execute()
             logger.info(f"已添加新管理员 {user_id} 并更新缓存")
             return True
         except Exception as e:
@@ -141,25 +271,41 @@ class AdminManager:
         """
         移除管理员，并同步到文件和 Redis
         """
-        from .redis_manager import redis_manager
         if user_id not in self._admins:
             return False  # 用户不是管理员
 
-        self._admins.remove(user_id)
-        await self._save_to_file()
+        self._set_admins(self._admins - {user_id})
+        self._mutations += 1
+        self._schedule_save()
         try:
-            await redis_manager.redis.srem(self._REDIS_KEY, user_id)
+            async with redis_manager.redis.pipeline(transaction=False) as pipe:
+                pipe.srem(self._REDIS_KEY, user_id)
+                pipe.publish(self._CHANNEL, user_id)
+                await pipe.execute()
             logger.info(f"已移除管理员 {user_id} 并更新缓存")
             return True
         except Exception as e:
             logger.error(f"从 Redis 移除管理员 {user_id} 失败: {e}")
             return False
 
-    async def get_all_admins(self) -> Set[int]:
+    async def get_all_admins(self) -> FrozenSet[int]:
         """
         获取所有管理员的集合
+
+        返回的是只读快照。本地集合在每次修改时整体替换，
+        因此可以直接返回而无需复制。
+        """
+        return self._admins
+
+    async def get_rendered_list(self) -> str:
+        """
+        获取每行一个 QQ 号的管理员列表文本
+
+        渲染结果会被缓存，直到管理员集合发生变化（包括从 Redis 刷新）。
         """
-        return self._admins.copy()
+        if self._rendered_cache is None:
+            self._rendered_cache = "\n".join(map(str, self._admins))
+        return self._rendered_cache
 
 
 # 全局 AdminManager 实例
@@ -4,11 +4,12 @@
 该模块定义了 `AccountAPI` Mixin 类，提供了所有与机器人自身账号信息、
 状态设置等相关的 OneBot v11 API 封装。
 """
-import json
 from typing import Dict, Any
 from .base import BaseAPI
 from models.objects import LoginInfo, VersionInfo, Status
-from core.redis_manager import redis_manager
+
+# 缓存键前缀
+_K_LOGIN_INFO = "neobot:cache:get_login_info:"
 
 
 class AccountAPI(BaseAPI):
@@ -26,14 +27,8 @@ class AccountAPI(BaseAPI):
         Returns:
             LoginInfo: 包含登录号 QQ 和昵称的 `LoginInfo` 数据对象。
         """
-        cache_key = f"neobot:cache:get_login_info:{self.self_id}"
-        if not no_cache:
-            cached_data = await redis_manager.get(cache_key)
-            if cached_data:
-                return LoginInfo(**json.loads(cached_data))
-
-        res = await self.call_api("get_login_info")
-        await redis_manager.set(cache_key, json.dumps(res), ex=3600)  # 缓存 1 小时
+        cache_key = _K_LOGIN_INFO + str(self.self_id)
+        res = await self._cached_call(cache_key, "get_login_info", no_cache=no_cache)
         return LoginInfo(**res)
 
     async def get_version_info(self) -> VersionInfo:
@@ -3,8 +3,35 @@ API 基础模块
 
 定义了 API 调用的基础接口。
 """
+import asyncio
+import zlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import orjson
+
+from core.executor import run_in_thread_pool
+from core.redis_manager import redis_manager
+
+# 负缓存条目的前缀字节，后面跟着实现端返回的失败响应
+NEGATIVE_CACHE_PREFIX = b"\x00"
+# 压缩缓存条目的前缀字节，后面跟着 zlib 压缩后的 JSON；未压缩的条目直接以 JSON 开头
+COMPRESSED_CACHE_PREFIX = b"\x01"
+
+# 读取缓存，不存在时写入给定值；返回最终保存在缓存中的值
+GET_OR_SET_SCRIPT = """
+local v = redis.call('GET', KEYS[1])
+if v then return v end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return ARGV[1]
+"""
+
+# 当前值与给定值不同时才写入（相同时保留原有过期时间）；返回是否写入
+SET_IF_CHANGED_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then return 0 end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
 
 
 class BaseAPI(ABC):
@@ -12,6 +39,12 @@ class BaseAPI(ABC):
     API 基础抽象类
     """
 
+    CACHE_TTL = 3600  # 成功响应的缓存时间（秒）
+    NEGATIVE_CACHE_TTL = 60  # 失败响应（如用户不存在）的缓存时间（秒）
+    LARGE_PAYLOAD = 64 * 1024  # 超过该大小（字节）的缓存值在线程池中压缩或解压
+    COMPRESS_THRESHOLD = 1024  # 超过该大小（字节）的缓存值压缩后写入
+    COMPRESS_LEVEL = 3  # zlib 压缩级别
+
     @abstractmethod
     async def call_api(self, action: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -22,3 +55,256 @@ class BaseAPI(ABC):
         :return: API 响应结果
         """
         raise NotImplementedError
+
+    async def _mget_cached(self, keys: List[str]) -> List[Optional[bytes]]:
+        """
+        批量读取缓存
+
+        使用非事务 pipeline 将多次 GET 合并为一次网络往返。
+
+        :param keys: 缓存键列表
+        :return: 与 keys 一一对应的缓存值列表，未命中的位置为 None
+        """
+        if not keys:
+            return []
+        async with redis_manager.cache.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(key)
+            return await pipe.execute()
+
+    async def _mset_cached(self, mapping: Dict[str, bytes], ex: int, elide: bool = False) -> None:
+        """
+        批量写入缓存
+
+        使用非事务 pipeline 将多次 SET 合并为一次网络往返。
+
+        :param mapping: 缓存键到缓存值的映射
+        :param ex: 过期时间（秒）
+        :param elide: 是否由 Redis 比较当前值，内容相同时跳过写入（保留原有过期时间）。
+                      仅适用于没有观察到缓存未命中的写入（如主动刷新、预热），
+                      未命中后的回填必须写入。
+        """
+        if not mapping:
+            return
+        script = self._set_if_changed_script() if elide else None
+        async with redis_manager.cache.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                if script is not None:
+                    await script(keys=[key], args=[value, ex], client=pipe)
+                else:
+                    pipe.set(key, value, ex=ex)
+            await pipe.execute()
+
+    def _set_if_changed_script(self):
+        """
+        获取“内容变化时才写入”的 Lua 脚本对象，首次调用时注册
+
+        比较在 Redis 上完成，多个进程写入同一个键时也不会因本地记录而跳过必要的写入。
+
+        :return: 已注册的脚本对象
+        """
+        script = self.__dict__.get("_set_if_changed")
+        if script is None:
+            script = self._set_if_changed = redis_manager.cache.register_script(SET_IF_CHANGED_SCRIPT)
+        return script
+
+    @staticmethod
+    def _is_negative(res: Any) -> bool:
+        """
+        判断响应是否为实现端明确返回的失败（如用户不存在）
+
+        超时、连接断开等临时失败没有 retcode 或 retcode 为 -1，不视为负结果。
+
+        :param res: API 响应
+        :return: 是否应作为负结果缓存
+        """
+        return isinstance(res, dict) and res.get("status") == "failed" and res.get("retcode", -1) > 0
+
+    @staticmethod
+    def _is_transient_failure(res: Any) -> bool:
+        """
+        判断响应是否为不应缓存的临时失败
+
+        :param res: API 响应
+        :return: 是否为临时失败
+        """
+        return isinstance(res, dict) and res.get("status") == "failed" and res.get("retcode", -1) <= 0
+
+    def _serialize_cached(self, res: Any) -> Optional[bytes]:
+        """
+        将 API 响应序列化为未压缩的缓存值
+
+        :param res: API 响应
+        :return: 缓存值，临时失败返回 None 表示不缓存
+        """
+        if self._is_transient_failure(res):
+            return None
+        if self._is_negative(res):
+            return NEGATIVE_CACHE_PREFIX + orjson.dumps(res)
+        return orjson.dumps(res)
+
+    def _needs_compression(self, payload: bytes) -> bool:
+        """
+        判断序列化后的缓存值是否需要压缩（负缓存条目不压缩）
+
+        :param payload: 未压缩的缓存值
+        :return: 是否需要压缩
+        """
+        return len(payload) > self.COMPRESS_THRESHOLD and payload[:1] != NEGATIVE_CACHE_PREFIX
+
+    def _compress_cached(self, payload: bytes) -> bytes:
+        """
+        压缩缓存值
+
+        :param payload: 未压缩的缓存值
+        :return: 带压缩前缀的缓存值
+        """
+        return COMPRESSED_CACHE_PREFIX + zlib.compress(payload, self.COMPRESS_LEVEL)
+
+    def _encode_cached(self, res: Any) -> Optional[bytes]:
+        """
+        将 API 响应编码为缓存值
+
+        :param res: API 响应
+        :return: 缓存值，临时失败返回 None 表示不缓存
+        """
+        payload = self._serialize_cached(res)
+        if payload is not None and self._needs_compression(payload):
+            return self._compress_cached(payload)
+        return payload
+
+    @staticmethod
+    def _decode_cached(data: bytes) -> Any:
+        """
+        解码缓存值，负缓存条目会还原为原始的失败响应，压缩条目会先解压
+
+        :param data: 缓存值
+        :return: API 响应
+        """
+        header = data[:1]
+        if header == COMPRESSED_CACHE_PREFIX:
+            return orjson.loads(zlib.decompress(data[1:]))
+        if header == NEGATIVE_CACHE_PREFIX:
+            return orjson.loads(data[1:])
+        return orjson.loads(data)
+
+    async def _encode_cached_async(self, res: Any) -> Optional[bytes]:
+        """
+        编码缓存值，较大缓存值的压缩在线程池中执行
+
+        orjson 编解码期间一直持有 GIL，放到线程池中同样会阻塞事件循环，因此直接执行；
+        只有 zlib 压缩会释放 GIL，较大的数据才值得交给线程池。
+
+        :param res: API 响应
+        :return: 缓存值，临时失败返回 None 表示不缓存
+        """
+        payload = self._serialize_cached(res)
+        if payload is None or not self._needs_compression(payload):
+            return payload
+        if len(payload) > self.LARGE_PAYLOAD:
+            return await run_in_thread_pool(self._compress_cached, payload)
+        return self._compress_cached(payload)
+
+    async def _decode_cached_async(self, data: bytes) -> Any:
+        """
+        解码缓存值，较大压缩条目的解压在线程池中执行（原因同 `_encode_cached_async`）
+
+        :param data: 缓存值
+        :return: API 响应
+        """
+        if len(data) > self.LARGE_PAYLOAD and data[:1] == COMPRESSED_CACHE_PREFIX:
+            return orjson.loads(await run_in_thread_pool(zlib.decompress, data[1:]))
+        return self._decode_cached(data)
+
+    async def _store_cached(self, cache_key: str, res: Any, elide: bool = False) -> None:
+        """
+        按响应类型写入缓存：成功响应缓存 1 小时，负结果缓存 1 分钟，临时失败不缓存
+
+        :param cache_key: 缓存键
+        :param res: API 响应
+        :param elide: 内容未变化时是否跳过写入，含义同 `_mset_cached`
+        """
+        data = await self._encode_cached_async(res)
+        if data is None:
+            return
+        ex = self._cache_ttl(data)
+        if elide:
+            await self._set_if_changed_script()(keys=[cache_key], args=[data, ex])
+        else:
+            await redis_manager.cache.set(cache_key, data, ex=ex)
+
+    async def _populate_cached(self, cache_key: str, res: Any) -> Any:
+        """
+        缓存未命中后回填缓存
+
+        通过 Lua 脚本在一次往返中完成“已存在则读取，否则写入”。
+        若其他进程已经抢先回填，则以缓存中的值为准。
+
+        :param cache_key: 缓存键
+        :param res: 刚从实现端获取的 API 响应
+        :return: 最终保存在缓存中的 API 响应
+        """
+        data = await self._encode_cached_async(res)
+        if data is None:
+            return res
+        ex = self._cache_ttl(data)
+        script = self.__dict__.get("_get_or_set_script")
+        if script is None:
+            script = self._get_or_set_script = redis_manager.cache.register_script(GET_OR_SET_SCRIPT)
+        stored = await script(keys=[cache_key], args=[data, ex])
+        if stored != data:
+            return await self._decode_cached_async(stored)
+        return res
+
+    def _cache_ttl(self, data: bytes) -> int:
+        """
+        根据缓存值类型返回过期时间
+
+        :param data: 缓存值
+        :return: 过期时间（秒）
+        """
+        return self.NEGATIVE_CACHE_TTL if data[:1] == NEGATIVE_CACHE_PREFIX else self.CACHE_TTL
+
+    async def _single_flight(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        合并同一个键上并发的请求
+
+        同一时刻只有第一个调用者会真正执行 factory，其余调用者等待同一个结果。
+        使用 shield 保证某个等待者被取消时不会取消其他人共享的请求。
+
+        :param key: 去重键，通常为缓存键
+        :param factory: 返回实际请求协程的函数
+        :return: 请求结果
+        """
+        inflight: Dict[str, asyncio.Task] = self.__dict__.setdefault("_inflight", {})
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _cached_call(self, cache_key: str, action: str, params: Optional[Dict[str, Any]] = None, no_cache: bool = False) -> Any:
+        """
+        带缓存、负缓存和请求合并的 API 调用
+
+        :param cache_key: 缓存键
+        :param action: API 动作名称
+        :param params: API 参数
+        :param no_cache: 是否跳过缓存读取
+        :return: API 响应结果
+        """
+        if not no_cache:
+            cached_data = await redis_manager.cache.get(cache_key)
+            if cached_data:
+                return await self._decode_cached_async(cached_data)
+
+        async def fetch():
+            res = await self.call_api(action, params)
+            if no_cache:
+                # 主动刷新：直接覆盖缓存，内容未变化时跳过写入
+                await self._store_cached(cache_key, res, elide=True)
+                return res
+            return await self._populate_cached(cache_key, res)
+
+        return await self._single_flight(cache_key, fetch)
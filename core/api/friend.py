@@ -4,11 +4,13 @@
 该模块定义了 `FriendAPI` Mixin 类，提供了所有与好友、陌生人信息
 等相关的 OneBot v11 API 封装。
 """
-import json
-from typing import List, Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
 from .base import BaseAPI
 from models.objects import FriendInfo, StrangerInfo
-from core.redis_manager import redis_manager
+
+# 缓存键前缀
+_K_STRANGER_INFO = "neobot:cache:get_stranger_info:"
+_K_FRIEND_LIST = "neobot:cache:get_friend_list:"
 
 
 class FriendAPI(BaseAPI):
@@ -16,18 +18,29 @@ class FriendAPI(BaseAPI):
     `FriendAPI` Mixin 类，提供了所有与好友、陌生人操作相关的 API 方法。
     """
 
-    async def send_like(self, user_id: int, times: int = 1) -> Dict[str, Any]:
+    async def send_like(self, user_id: int, times: int = 1) -> Tuple[bool, Optional[str]]:
         """
         向指定用户发送 "戳一戳" (点赞)。
 
+        发送失败（如连接断开）或实现端返回失败响应时不会抛出异常，
+        而是通过返回值告知失败原因。
+
         Args:
             user_id (int): 目标用户的 QQ 号。
             times (int, optional): 点赞次数，建议不超过 10 次。Defaults to 1.
 
         Returns:
-            Dict[str, Any]: OneBot API 的响应数据。
+            Tuple[bool, Optional[str]]: `(是否成功, 失败原因)`，成功时失败原因为 None。
         """
-        return await self.call_api("send_like", {"user_id": user_id, "times": times})
+        try:
+            res = await self.call_api("send_like", {"user_id": user_id, "times": times})
+        except Exception as e:
+            # 只有连接断开等发送失败会抛出异常
+            return False, str(e)
+        # 实现端拒绝或超时会以 status 为 failed 的响应返回
+        if res.get("status") == "failed":
+            return False, res.get("wording") or res.get("message") or res.get("msg") or "未知错误"
+        return True, None
 
     async def get_stranger_info(self, user_id: int, no_cache: bool = False) -> StrangerInfo:
         """
@@ -40,14 +53,8 @@ class FriendAPI(BaseAPI):
         Returns:
             StrangerInfo: 包含陌生人信息的 `StrangerInfo` 数据对象。
         """
-        cache_key = f"neobot:cache:get_stranger_info:{user_id}"
-        if not no_cache:
-            cached_data = await redis_manager.redis.get(cache_key)
-            if cached_data:
-                return StrangerInfo(**json.loads(cached_data))
-
-        res = await self.call_api("get_stranger_info", {"user_id": user_id, "no_cache": no_cache})
-        await redis_manager.redis.set(cache_key, json.dumps(res), ex=3600)  # 缓存 1 小时
+        cache_key = _K_STRANGER_INFO + str(user_id)
+        res = await self._cached_call(cache_key, "get_stranger_info", {"user_id": user_id, "no_cache": no_cache}, no_cache=no_cache)
         return StrangerInfo(**res)
 
     async def get_friend_list(self, no_cache: bool = False) -> List[FriendInfo]:
@@ -60,14 +67,8 @@ class FriendAPI(BaseAPI):
         Returns:
             List[FriendInfo]: 包含所有好友信息的 `FriendInfo` 对象列表。
         """
-        cache_key = f"neobot:cache:get_friend_list:{self.self_id}"
-        if not no_cache:
-            cached_data = await redis_manager.redis.get(cache_key)
-            if cached_data:
-                return [FriendInfo(**item) for item in json.loads(cached_data)]
-
-        res = await self.call_api("get_friend_list")
-        await redis_manager.redis.set(cache_key, json.dumps(res), ex=3600)  # 缓存 1 小时
+        cache_key = _K_FRIEND_LIST + str(self.self_id)
+        res = await self._cached_call(cache_key, "get_friend_list", no_cache=no_cache)
         return [FriendInfo(**item) for item in res]
 
     async def set_friend_add_request(self, flag: str, approve: bool = True, remark: str = "") -> Dict[str, Any]:
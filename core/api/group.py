@@ -4,11 +4,14 @@
 该模块定义了 `GroupAPI` Mixin 类，提供了所有与群组管理、成员操作
 等相关的 OneBot v11 API 封装。
 """
-from typing import List, Dict, Any, Optional
-import json
-from core.redis_manager import redis_manager
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 from .base import BaseAPI
-from models.objects import GroupInfo, GroupMemberInfo, GroupHonorInfo
+from models.objects import GroupInfo, GroupMemberInfo, GroupMemberTable, GroupHonorInfo
+
+# 缓存键前缀
+_K_GROUP_INFO = "neobot:cache:get_group_info:"
+_K_MEMBER_INFO = "neobot:cache:get_group_member_info:"
 
 
 class GroupAPI(BaseAPI):
@@ -176,14 +179,8 @@ class GroupAPI(BaseAPI):
         Returns:
             GroupInfo: 包含群组信息的 `GroupInfo` 数据对象。
         """
-        cache_key = f"neobot:cache:get_group_info:{group_id}"
-        if not no_cache:
-            cached_data = await redis_manager.redis.get(cache_key)
-            if cached_data:
-                return GroupInfo(**json.loads(cached_data))
-
-        res = await self.call_api("get_group_info", {"group_id": group_id})
-        await redis_manager.redis.set(cache_key, json.dumps(res), ex=3600)  # 缓存 1 小时
+        cache_key = _K_GROUP_INFO + str(group_id)
+        res = await self._cached_call(cache_key, "get_group_info", {"group_id": group_id}, no_cache=no_cache)
         return GroupInfo(**res)
 
     async def get_group_list(self) -> List[GroupInfo]:
@@ -208,29 +205,137 @@ class GroupAPI(BaseAPI):
         Returns:
             GroupMemberInfo: 包含群成员信息的 `GroupMemberInfo` 数据对象。
         """
-        cache_key = f"neobot:cache:get_group_member_info:{group_id}:{user_id}"
-        if not no_cache:
-            cached_data = await redis_manager.redis.get(cache_key)
-            if cached_data:
-                return GroupMemberInfo(**json.loads(cached_data))
-
-        res = await self.call_api("get_group_member_info", {"group_id": group_id, "user_id": user_id})
-        await redis_manager.redis.set(cache_key, json.dumps(res), ex=3600)  # 缓存 1 小时
+        cache_key = _K_MEMBER_INFO + str(group_id) + ":" + str(user_id)
+        res = await self._cached_call(cache_key, "get_group_member_info", {"group_id": group_id, "user_id": user_id}, no_cache=no_cache)
         return GroupMemberInfo(**res)
 
+    async def get_group_member_infos(self, group_id: int, user_ids: List[int], no_cache: bool = False) -> List[GroupMemberInfo]:
+        """
+        批量获取同一群组内多个成员的详细信息。
+
+        所有缓存键会通过一次 pipeline 读取，只有未命中的成员才会调用 API，
+        其结果再通过一次 pipeline 写回缓存。
+
+        Args:
+            group_id (int): 目标群组的群号。
+            user_ids (List[int]): 目标成员的 QQ 号列表。
+            no_cache (bool, optional): 是否不使用缓存。Defaults to False.
+
+        Returns:
+            List[GroupMemberInfo]: 与 `user_ids` 顺序一致的 `GroupMemberInfo` 对象列表。
+        """
+        prefix = _K_MEMBER_INFO + str(group_id) + ":"
+        keys = [prefix + str(user_id) for user_id in user_ids]
+        cached = [None] * len(keys) if no_cache else await self._mget_cached(keys)
+
+        results = [self._decode_cached(cached_data) if cached_data else None for cached_data in cached]
+        miss_indexes = [i for i, res in enumerate(results) if res is None]
+        if miss_indexes:
+            fetched = await asyncio.gather(*(
+                self._single_flight(keys[i], lambda user_id=user_ids[i]: self.call_api(
+                    "get_group_member_info", {"group_id": group_id, "user_id": user_id}
+                ))
+                for i in miss_indexes
+            ))
+            positive: Dict[str, bytes] = {}
+            negative: Dict[str, bytes] = {}
+            for i, res in zip(miss_indexes, fetched):
+                results[i] = res
+                data = self._encode_cached(res)
+                if data is not None:
+                    (negative if self._is_negative(res) else positive)[keys[i]] = data
+            await self._mset_cached(positive, ex=self.CACHE_TTL, elide=no_cache)
+            await self._mset_cached(negative, ex=self.NEGATIVE_CACHE_TTL, elide=no_cache)
+
+        return [GroupMemberInfo(**res) for res in results]
+
     async def get_group_member_list(self, group_id: int) -> List[GroupMemberInfo]:
         """
         获取一个群组的所有成员列表。
 
+        获取到的成员信息会顺带写入 `get_group_member_info` 的缓存。
+
         Args:
             group_id (int): 目标群组的群号。
 
         Returns:
             List[GroupMemberInfo]: 包含所有群成员信息的 `GroupMemberInfo` 对象列表。
         """
-        res = await self.call_api("get_group_member_list", {"group_id": group_id})
+        res = await self._fetch_group_member_list(group_id)
         return [GroupMemberInfo(**item) for item in res]
 
+    async def iter_group_members(self, group_id: int) -> AsyncIterator[GroupMemberInfo]:
+        """
+        逐个产出群组的成员信息。
+
+        与 `get_group_member_list` 相同，但 `GroupMemberInfo` 对象按需创建，
+        调用方提前结束遍历时不会为剩余成员分配对象。
+
+        Args:
+            group_id (int): 目标群组的群号。
+
+        Yields:
+            GroupMemberInfo: 群成员信息对象。
+        """
+        for item in await self._fetch_group_member_list(group_id):
+            yield GroupMemberInfo(**item)
+
+    async def get_group_member_columns(self, group_id: int) -> Dict[str, Sequence[Any]]:
+        """
+        以列的形式获取群组的成员信息。
+
+        适用于只需要对少数字段做批量统计的场景（如统计管理员数量），
+        不会为每个成员创建 `GroupMemberInfo` 对象。整数字段使用 `array('q')` 存储。
+
+        Args:
+            group_id (int): 目标群组的群号。
+
+        Returns:
+            Dict[str, Sequence[Any]]: 列名到列数据的映射，各列按下标一一对应。
+                包含 `user_id`、`join_time`、`last_sent_time`、`role_code`（`array`），
+                以及 `role`、`nickname`、`card`（`list`）。
+        """
+        table = await self.get_group_member_table(group_id)
+        return {name: getattr(table, name) for name in GroupMemberTable.__slots__}
+
+    async def get_group_member_table(self, group_id: int) -> GroupMemberTable:
+        """
+        以按列存储的 `GroupMemberTable` 获取群组的成员信息。
+
+        Args:
+            group_id (int): 目标群组的群号。
+
+        Returns:
+            GroupMemberTable: 群成员表，可用 `filter_by_role` 等方法批量筛选。
+        """
+        res = await self._fetch_group_member_list(group_id)
+        return GroupMemberTable.from_dicts(res)
+
+    async def _fetch_group_member_list(self, group_id: int) -> List[Dict[str, Any]]:
+        """
+        调用 `get_group_member_list` 并顺带写入各成员的 `get_group_member_info` 缓存。
+
+        Args:
+            group_id (int): 目标群组的群号。
+
+        Returns:
+            List[Dict[str, Any]]: 原始的群成员信息字典列表，调用失败时为空列表。
+        """
+        res = await self.call_api("get_group_member_list", {"group_id": group_id})
+        if res.get("status") == "failed":
+            # 失败响应不写入任何成员缓存
+            return []
+        members = res.get("data") or []
+        prefix = _K_MEMBER_INFO + str(group_id) + ":"
+        mapping: Dict[str, bytes] = {}
+        for item in members:
+            # 与 `get_group_member_info` 经 `_cached_call` 写入的响应格式保持一致
+            data = self._encode_cached({"status": "ok", "retcode": 0, "data": item})
+            if data is not None:
+                mapping[prefix + str(item["user_id"])] = data
+        await self._mset_cached(mapping, ex=self.CACHE_TTL, elide=True)
+        return members
+
     async def get_group_honor_info(self, group_id: int, type: str) -> GroupHonorInfo:
         """
         获取群组的荣誉信息（如龙王、群聊之火等）。
@@ -4,11 +4,39 @@
 该模块定义了 `MessageAPI` Mixin 类，提供了所有与消息发送、撤回、
 转发等相关的 OneBot v11 API 封装。
 """
-from typing import Union, List, Dict, Any, TYPE_CHECKING
+import asyncio
+from typing import Union, List, Dict, Any, Awaitable, Callable, TYPE_CHECKING
+from models.message import MessageSegment
 from .base import BaseAPI
 
 if TYPE_CHECKING:
-    from models import MessageSegment, OneBotEvent
+    from models import OneBotEvent
+
+
+async def _send_by_reply(api: "MessageAPI", event: "OneBotEvent", message: Any, auto_escape: bool) -> Dict[str, Any]:
+    """
+    `send` 的实现：消息事件直接调用事件自身的 `reply` 方法
+    """
+    await event.reply(message, auto_escape)
+    return {"status": "ok", "msg": "Replied via event.reply()"}
+
+
+async def _send_by_target(api: "MessageAPI", event: "OneBotEvent", message: Any, auto_escape: bool) -> Dict[str, Any]:
+    """
+    `send` 的实现：根据事件中的 group_id 或 user_id 选择发送目标
+    """
+    group_id = getattr(event, "group_id", None)
+    if group_id:
+        return await api.send_group_msg(group_id, message, auto_escape)
+    user_id = getattr(event, "user_id", None)
+    if user_id:
+        return await api.send_private_msg(user_id, message, auto_escape)
+    
+    return {"status": "failed", "msg": "Unknown message target"}
+
+
+# 事件类型到 `send` 实现的映射，首次遇到某个事件类型时确定
+_SEND_DISPATCH: Dict[type, Callable[["MessageAPI", "OneBotEvent", Any, bool], Awaitable[Dict[str, Any]]]] = {}
 
 
 class MessageAPI(BaseAPI):
@@ -16,6 +44,8 @@ class MessageAPI(BaseAPI):
     `MessageAPI` Mixin 类，提供了所有与消息操作相关的 API 方法。
     """
 
+    FORWARD_CONCURRENCY = 16  # 多群合并转发时同时进行的请求数量上限
+
     async def send_group_msg(self, group_id: int, message: Union[str, "MessageSegment", List["MessageSegment"]], auto_escape: bool = False) -> Dict[str, Any]:
         """
         发送群消息。
@@ -65,21 +95,12 @@ class MessageAPI(BaseAPI):
         Returns:
             Dict[str, Any]: OneBot API 的响应数据。
         """
-        # 如果是消息事件，直接调用 reply
-        if hasattr(event, "reply"):
-            await event.reply(message, auto_escape)
-            return {"status": "ok", "msg": "Replied via event.reply()"}
-
-        # 尝试从事件中获取 user_id 或 group_id
-        user_id = getattr(event, "user_id", None)
-        group_id = getattr(event, "group_id", None)
-
-        if group_id:
-            return await self.send_group_msg(group_id, message, auto_escape)
-        elif user_id:
-            return await self.send_private_msg(user_id, message, auto_escape)
-        
-        return {"status": "failed", "msg": "Unknown message target"}
+        event_type = type(event)
+        impl = _SEND_DISPATCH.get(event_type)
+        if impl is None:
+            # 消息事件直接调用 reply，其余事件从 group_id 或 user_id 中获取发送目标
+            impl = _SEND_DISPATCH[event_type] = _send_by_reply if hasattr(event_type, "reply") else _send_by_target
+        return await impl(self, event, message, auto_escape)
 
     async def delete_msg(self, message_id: int) -> Dict[str, Any]:
         """
@@ -131,6 +152,49 @@ class MessageAPI(BaseAPI):
         """
         return await self.call_api("send_group_forward_msg", {"group_id": group_id, "messages": messages})
 
+    async def send_group_forward_msg_multi(self, group_ids: List[int], messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        向多个群组并发发送同一条合并转发消息。
+
+        所有群组共享同一份消息节点列表，同时进行的请求数量不超过 `FORWARD_CONCURRENCY`。
+
+        Args:
+            group_ids (List[int]): 目标群组的群号列表。
+            messages (List[Dict[str, Any]]): 消息节点列表。
+                推荐使用 `bot.build_forward_node` 来构建节点。
+
+        Returns:
+            List[Dict[str, Any]]: 与 `group_ids` 顺序一致的 OneBot API 响应数据列表。
+        """
+        return await self._call_api_bounded(
+            "send_group_forward_msg",
+            [{"group_id": group_id, "messages": messages} for group_id in group_ids],
+            self.FORWARD_CONCURRENCY,
+        )
+
+    async def _call_api_bounded(self, action: str, params_list: List[Dict[str, Any]], concurrency: int) -> List[Dict[str, Any]]:
+        """
+        内部方法：以有限的并发数对多组参数调用同一个 API。
+
+        使用信号量限制同时进行的请求数量，某个请求完成后立即开始下一个，
+        不需要等待整批请求结束。
+
+        Args:
+            action (str): API 的动作名称。
+            params_list (List[Dict[str, Any]]): 每次调用的参数字典。
+            concurrency (int): 同时进行的请求数量上限。
+
+        Returns:
+            List[Dict[str, Any]]: 与 `params_list` 顺序一致的 OneBot API 响应数据列表。
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call_one(params: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.call_api(action, params)
+
+        return await asyncio.gather(*(call_one(params) for params in params_list))
+
     async def send_private_forward_msg(self, user_id: int, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         发送私聊合并转发消息。
@@ -176,11 +240,16 @@ class MessageAPI(BaseAPI):
         Returns:
             处理后的消息内容。
         """
+        # 纯文本是最常见的情况，先用类型恒等比较快速返回
+        message_type = type(message)
+        if message_type is str:
+            return message
+        if message_type is list:
+            return [self._segment_to_dict(m) for m in message if isinstance(m, MessageSegment)]
+
+        # 子类等少见情况
         if isinstance(message, str):
             return message
-        
-        # 避免循环导入，在运行时导入
-        from models import MessageSegment
 
         if isinstance(message, MessageSegment):
             return [self._segment_to_dict(message)]
@@ -194,14 +263,13 @@ class MessageAPI(BaseAPI):
         """
         内部方法：将 `MessageSegment` 对象转换为字典。
 
+        转换结果缓存在消息段上（见 `MessageSegment.to_dict`），重复发送同一个消息段时直接复用。
+
         Args:
             segment (MessageSegment): 消息段对象。
 
         Returns:
             Dict[str, Any]: 符合 OneBot 规范的消息段字典。
         """
-        return {
-            "type": segment.type,
-            "data": segment.data
-        }
+        return segment.to_dict()
 
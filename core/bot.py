@@ -10,7 +10,8 @@ Bot 核心抽象模块
 - 提供高级消息发送功能，如 `send_forwarded_messages`。
 - 整合所有细分的 API 调用（消息、群组、好友等）。
 """
-from typing import TYPE_CHECKING, Dict, Any, List, Union
+import asyncio
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Sequence, Tuple, Union
 from models.events.base import OneBotEvent
 from models.message import MessageSegment
 
@@ -52,6 +53,43 @@ class Bot(MessageAPI, GroupAPI, FriendAPI, AccountAPI):
         """
         return await self.ws.call_api(action, params)
 
+    async def call_api_many(self, calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """
+        并发执行多个 API 调用。
+
+        所有请求会立即依次写入 WebSocket，再统一等待响应（通过 `echo` 字段匹配），
+        总耗时约为一次往返，而不是逐个 `await call_api` 时的 N 次往返。
+
+        Args:
+            calls (Sequence[Tuple[str, Optional[Dict[str, Any]]]]): `(action, params)` 元组列表。
+
+        Returns:
+            List[Any]: 与 `calls` 顺序一致的 OneBot API 响应数据列表。
+        """
+        return await asyncio.gather(*(self.call_api(action, params) for action, params in calls))
+
+    async def broadcast(self, targets: Sequence[int], message: Union[str, "MessageSegment", List["MessageSegment"]], concurrency: int = 50, auto_escape: bool = False) -> List[Dict[str, Any]]:
+        """
+        向多个群组广播同一条消息。
+
+        消息内容只转换一次；同时进行的发送请求不超过 `concurrency` 个。
+
+        Args:
+            targets (Sequence[int]): 目标群号列表。
+            message (Union[str, MessageSegment, List[MessageSegment]]): 要发送的消息内容。
+            concurrency (int, optional): 同时进行的发送请求数量上限。Defaults to 50.
+            auto_escape (bool, optional): 是否对消息内容进行 CQ 码转义。Defaults to False.
+
+        Returns:
+            List[Dict[str, Any]]: 与 `targets` 顺序一致的 OneBot API 响应数据列表。
+        """
+        processed = self._process_message(message)
+        return await self._call_api_bounded(
+            "send_group_msg",
+            [{"group_id": group_id, "message": processed, "auto_escape": auto_escape} for group_id in targets],
+            concurrency,
+        )
+
     def build_forward_node(self, user_id: int, nickname: str, message: Union[str, "MessageSegment", List["MessageSegment"]]) -> Dict[str, Any]:
         """
         构建一个用于合并转发的消息节点 (Node)。
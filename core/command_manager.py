@@ -31,6 +31,10 @@ class CommandManager:
             prefixes (Tuple[str, ...]): 一个包含所有合法命令前缀的元组。
         """
         self.plugins: Dict[str, Dict[str, Any]] = {}
+        self._help_cache: Optional[str] = None  # 渲染好的 /help 文本，插件元数据变化时清空
+
+        # 静态配置在初始化时读取一次，避免每个事件都查询配置
+        self._ignore_self = bool(global_config.bot.get('ignore_self_message', False))
         
         # 初始化专门的事件处理器
         self.message_handler = MessageHandler(prefixes)
@@ -53,11 +57,22 @@ class CommandManager:
         """
         # Help 命令
         self.message_handler.command("help")(self._help_command)
-        self.plugins["core.help"] = {
+        self.register_plugin_meta("core.help", {
             "name": "帮助",
             "description": "显示所有可用指令的帮助信息",
             "usage": "/help",
-        }
+        })
+
+    def register_plugin_meta(self, plugin_name: str, meta: Dict[str, Any]):
+        """
+        注册（或在热重载时更新）插件元数据，并使 /help 文本缓存失效。
+
+        Args:
+            plugin_name (str): 插件的完整模块名。
+            meta (Dict[str, Any]): 插件的 `__plugin_meta__` 字典。
+        """
+        self.plugins[plugin_name] = meta
+        self._help_cache = None
 
     # --- 装饰器代理 ---
 
@@ -102,11 +117,12 @@ class CommandManager:
 
         根据事件的 `post_type` 将其分发给对应的处理器。
         """
-        if event.post_type == 'message' and global_config.bot.get('ignore_self_message', False):
-            if hasattr(event, 'user_id') and hasattr(event, 'self_id') and event.user_id == event.self_id:
-                return
+        post_type = event.post_type
+        # 消息事件都继承自 MessageEvent，必定带有 user_id 和 self_id，可直接访问
+        if self._ignore_self and post_type == 'message' and event.user_id == event.self_id:
+            return
 
-        handler = self.handler_map.get(event.post_type)
+        handler = self.handler_map.get(post_type)
         if handler:
             await handler.handle(bot, event)
 
@@ -116,18 +132,24 @@ class CommandManager:
         """
         内置的 `/help` 命令的实现。
         """
-        help_text = "--- 可用指令列表 ---\n"
+        if self._help_cache is None:
+            self._help_cache = self._render_help()
+        await bot.send(event, self._help_cache)
+
+    def _render_help(self) -> str:
+        """
+        渲染 /help 文本。
+        """
+        parts = ["--- 可用指令列表 ---"]
         
         for plugin_name, meta in self.plugins.items():
             name = meta.get("name", "未命名插件")
             description = meta.get("description", "暂无描述")
             usage = meta.get("usage", "暂无用法说明")
             
-            help_text += f"\n{name}:\n"
-            help_text += f"  功能: {description}\n"
-            help_text += f"  用法: {usage}\n"
+            parts.append(f"\n{name}:\n  功能: {description}\n  用法: {usage}")
             
-        await bot.send(event, help_text.strip())
+        return "\n".join(parts).strip()
 
 
 # --- 全局单例 ---
@@ -22,56 +22,35 @@ class Config:
         """
         self.path = Path(file_path)
         self._data: Dict[str, Any] = {}
+
+        # 各配置段在加载后作为普通属性保存，访问时无需经过 property
+        self.napcat_ws: dict = {}
+        """NapCat WebSocket 配置"""
+        self.bot: dict = {}
+        """Bot 基础配置"""
+        self.features: dict = {}
+        """功能特性配置"""
+        self.redis: dict = {}
+        """Redis 配置"""
+
         self.load()
 
     def load(self):
         """
-        加载配置文件
+        加载配置文件，并刷新各配置段属性
 
         :raises FileNotFoundError: 如果配置文件不存在
         """
-        if not self.path.exists():
-            raise FileNotFoundError(f"配置文件 {self.path} 未找到！")
-
-        with open(self.path, "rb") as f:
-            self._data = tomllib.load(f)
-
-    # 通过属性访问配置
-    @property
-    def napcat_ws(self) -> dict:
-        """
-        获取 NapCat WebSocket 配置
-
-        :return: 配置字典
-        """
-        return self._data.get("napcat_ws", {})
-
-    @property
-    def bot(self) -> dict:
-        """
-        获取 Bot 基础配置
+        try:
+            with open(self.path, "rb") as f:
+                self._data = tomllib.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"配置文件 {self.path} 未找到！") from None
 
-        :return: 配置字典
-        """
-        return self._data.get("bot", {})
-
-    @property
-    def features(self) -> dict:
-        """
-        获取功能特性配置
-
-        :return: 配置字典
-        """
-        return self._data.get("features", {})
-
-    @property
-    def redis(self) -> dict:
-        """
-        获取 Redis 配置
-
-        :return: 配置字典
-        """
-        return self._data.get("redis", {})
+        self.napcat_ws = self._data.get("napcat_ws", {})
+        self.bot = self._data.get("bot", {})
+        self.features = self._data.get("features", {})
+        self.redis = self._data.get("redis", {})
 
 
 # 实例化全局配置对象
@@ -5,8 +5,10 @@
 每个处理器都负责注册和分发特定类型的事件。
 """
 import inspect
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from .bot import Bot
 from .permission_manager import Permission, permission_manager
@@ -14,12 +16,126 @@ from .exceptions import SyncHandlerError
 from .executor import run_in_thread_pool
 
 
+def get_param_names(func: Callable) -> FrozenSet[str]:
+    """
+    获取处理器函数声明的参数名集合
+
+    在注册处理器时调用一次，避免每次分发事件都执行 inspect.signature。
+
+    :param func: 处理器函数
+    :return: 参数名集合
+    """
+    return frozenset(inspect.signature(func).parameters)
+
+
+def make_adapter(func: Callable, params: FrozenSet[str]) -> Callable[..., Any]:
+    """
+    为处理器生成参数适配函数
+
+    适配函数统一接收 (bot, event, args, permission_granted[, raw_args])，
+    并只把处理器声明过的参数传给它。常见的参数组合使用固定的 lambda，
+    分发事件时不需要再构建 kwargs 字典。
+
+    :param func: 处理器函数
+    :param params: 处理器参数名集合
+    :return: 适配函数
+    """
+    wants_bot = "bot" in params
+    wants_event = "event" in params
+
+    if params.isdisjoint(("args", "permission_granted", "raw_args")):
+        if wants_bot and wants_event:
+            return lambda bot, event, args, permission_granted, raw_args=None: func(bot=bot, event=event)
+        if wants_event:
+            return lambda bot, event, args, permission_granted, raw_args=None: func(event=event)
+        if wants_bot:
+            return lambda bot, event, args, permission_granted, raw_args=None: func(bot=bot)
+        return lambda bot, event, args, permission_granted, raw_args=None: func()
+
+    wants_args = "args" in params
+    wants_permission = "permission_granted" in params
+    wants_raw_args = "raw_args" in params
+
+    def adapter(
+        bot: Bot,
+        event: Any,
+        args: Optional[List[str]],
+        permission_granted: Optional[bool],
+        raw_args: Optional[str] = None,
+    ) -> Any:
+        kwargs = {}
+        if wants_bot:
+            kwargs["bot"] = bot
+        if wants_event:
+            kwargs["event"] = event
+        if wants_args and args is not None:
+            kwargs["args"] = args
+        if wants_permission and permission_granted is not None:
+            kwargs["permission_granted"] = permission_granted
+        if wants_raw_args and raw_args is not None:
+            kwargs["raw_args"] = raw_args
+        return func(**kwargs)
+
+    return adapter
+
+
+@dataclass(slots=True)
+class HandlerRecord:
+    """
+    处理器记录，预先保存分发时需要的所有信息
+
+    :param func: 处理器函数
+    :param params: 处理器参数名集合
+    :param adapter: 由 `make_adapter` 生成的参数适配函数
+    :param is_coroutine: 处理器是否为异步函数
+    :param type: 处理器监听的事件子类型，None 表示全部（通知、请求处理器使用）
+    """
+    func: Callable
+    params: FrozenSet[str]
+    adapter: Callable
+    is_coroutine: bool
+    type: Optional[str] = None
+
+
+@dataclass(slots=True)
+class CommandRecord(HandlerRecord):
+    """
+    指令处理器记录
+
+    :param permission: 执行指令所需的权限，None 表示不限制
+    :param override_permission_check: 权限不足时是否仍调用处理器（由处理器自行判断）
+    :param fast_path: 指令不需要权限，分发时跳过权限检查
+    """
+    permission: Optional[Permission] = None
+    override_permission_check: bool = False
+    fast_path: bool = False
+
+
+def build_handler_record(func: Callable, record_cls: type = HandlerRecord, **extra: Any) -> HandlerRecord:
+    """
+    构建处理器记录，预先计算分发时需要的所有信息
+
+    :param func: 处理器函数
+    :param record_cls: 记录类型，`HandlerRecord` 或其子类
+    :param extra: 记录中的其他字段（如指令权限、事件类型）
+    :return: 处理器记录
+    """
+    params = get_param_names(func)
+    return record_cls(
+        func=func,
+        params=params,
+        adapter=make_adapter(func, params),
+        is_coroutine=inspect.iscoroutinefunction(func),
+        **extra,
+    )
+
+
 class BaseHandler(ABC):
     """
     事件处理器抽象基类
     """
     def __init__(self):
-        self.handlers: List[Dict[str, Any]] = []
+        self.handlers: List[HandlerRecord] = []
 
     @abstractmethod
     async def handle(self, bot: Bot, event: Any):
@@ -30,7 +146,7 @@ class BaseHandler(ABC):
 
     async def _run_handler(
         self,
-        func: Callable,
+        handler: HandlerRecord,
         bot: Bot,
         event: Any,
         args: Optional[List[str]] = None,
@@ -38,25 +154,14 @@ class BaseHandler(ABC):
     ):
         """
         智能执行事件处理器，并注入所需参数
-        """
-        sig = inspect.signature(func)
-        params = sig.parameters
-        kwargs = {}
-
-        if "bot" in params:
-            kwargs["bot"] = bot
-        if "event" in params:
-            kwargs["event"] = event
-        if "args" in params and args is not None:
-            kwargs["args"] = args
-        if "permission_granted" in params and permission_granted is not None:
-            kwargs["permission_granted"] = permission_granted
 
-        if inspect.iscoroutinefunction(func):
-            result = await func(**kwargs)
+        :param handler: 由 `build_handler_record` 构建的处理器记录
+        """
+        if handler.is_coroutine:
+            result = await handler.adapter(bot, event, args, permission_granted)
         else:
             # 如果是同步函数，则放入线程池执行
-            result = await run_in_thread_pool(func, **kwargs)
+            result = await run_in_thread_pool(handler.adapter, bot, event, args, permission_granted)
         return result is True
 
 
@@ -64,11 +169,39 @@ class MessageHandler(BaseHandler):
     """
     消息事件处理器
     """
+    COMMAND_ALTERNATION_LIMIT = 32  # 指令数超过该值时，正则只切出指令名，再用字典查找
+
     def __init__(self, prefixes: Tuple[str, ...]):
         super().__init__()
         self.prefixes = prefixes
-        self.commands: Dict[str, Dict] = {}
-        self.message_handlers: List[Callable] = []
+        # 空前缀不参与匹配
+        self._prefix_tuple = tuple(p for p in prefixes if p)
+        self.commands: Dict[str, CommandRecord] = {}
+        self.message_handlers: List[HandlerRecord] = []
+        self._command_re: Optional[re.Pattern] = None
+
+    def _rebuild_command_re(self):
+        """
+        重新编译“前缀 + 指令名 + 参数”的匹配正则，在注册指令后调用
+
+        前缀放在原子组中并按配置顺序排列，第一个匹配的前缀即被采用、不会回溯，
+        与逐个 startswith 的结果一致。指令名按长度降序排列，并要求其后是空白或结尾。
+
+        指令很多时，逐个尝试的指令名分支会变慢，此时改为只匹配第一个非空白片段，
+        再通过字典查找指令，耗时只与指令名长度有关。
+        """
+        if not self._prefix_tuple or not self.commands:
+            self._command_re = None
+            return
+        prefix_alt = "|".join(re.escape(p) for p in self._prefix_tuple)
+        if len(self.commands) > self.COMMAND_ALTERNATION_LIMIT:
+            name_alt = r"\S+"
+        else:
+            name_alt = "|".join(re.escape(n) for n in sorted(self.commands, key=len, reverse=True))
+        self._command_re = re.compile(
+            rf"(?>{prefix_alt})\s*(?P<cmd>{name_alt})(?:\s+(?P<rest>.*))?\Z",
+            re.DOTALL,
+        )
 
     def on_message(self) -> Callable:
         """
@@ -77,7 +210,7 @@ class MessageHandler(BaseHandler):
         def decorator(func: Callable) -> Callable:
             if not inspect.iscoroutinefunction(func):
                 raise SyncHandlerError(f"消息处理器 {func.__name__} 必须是异步函数 (async def).")
-            self.message_handlers.append(func)
+            self.message_handlers.append(build_handler_record(func))
             return func
         return decorator
 
@@ -93,11 +226,14 @@ class MessageHandler(BaseHandler):
         def decorator(func: Callable) -> Callable:
             if not inspect.iscoroutinefunction(func):
                 raise SyncHandlerError(f"命令处理器 {func.__name__} 必须是异步函数 (async def).")
-            self.commands[name] = {
-                "func": func,
-                "permission": permission,
-                "override_permission_check": override_permission_check,
-            }
+            self.commands[name] = build_handler_record(
+                func,
+                CommandRecord,
+                permission=permission,
+                override_permission_check=override_permission_check,
+                fast_path=permission is None,
+            )
+            self._rebuild_command_re()
             return func
         return decorator
 
@@ -114,84 +250,100 @@ class MessageHandler(BaseHandler):
             return
 
         raw_text = event.raw_message.strip()
-        prefix_found = next((p for p in self.prefixes if raw_text.startswith(p)), None)
-
-        if not prefix_found:
+        # 绝大多数消息不是指令，先用 C 实现的 startswith 快速排除
+        if self._command_re is None or not raw_text.startswith(self._prefix_tuple):
             return
 
-        full_cmd = raw_text[len(prefix_found):].split()
-        if not full_cmd:
+        # 一次匹配同时得到指令名和参数部分
+        command_match = self._command_re.match(raw_text)
+        if command_match is None:
             return
 
-        cmd_name = full_cmd[0]
-        args = full_cmd[1:]
-
-        if cmd_name in self.commands:
-            command_info = self.commands[cmd_name]
-            func = command_info["func"]
-            permission = command_info.get("permission")
-            override_check = command_info.get("override_permission_check", False)
-
-            permission_granted = True
-            if permission:
-                permission_granted = await permission_manager.check_permission(event.user_id, permission)
+        command_info = self.commands.get(command_match["cmd"])
+        if command_info is None:
+            return
 
-            if not permission_granted and not override_check:
+        # 大多数指令不需要权限，注册时已标记为 fast_path，直接跳过权限检查
+        permission_granted = True
+        if not command_info.fast_path:
+            permission = command_info.permission
+            permission_granted = await permission_manager.check_permission(event.user_id, permission)
+            if not permission_granted and not command_info.override_permission_check:
                 await bot.send(event, f"权限不足，需要 {permission.name} 权限")
                 return
 
-            await self._run_handler(
-                func,
-                bot,
-                event,
-                args=args,
-                permission_granted=permission_granted
-            )
+        # raw_args 是指令名之后未拆分的原始文本，只有处理器声明了 args 参数时才拆分参数
+        raw_args = command_match["rest"] or ""
+        args = raw_args.split() if "args" in command_info.params else None
+
+        # 指令处理器在注册时已确保是异步函数，直接调用适配函数
+        await command_info.adapter(bot, event, args, permission_granted, raw_args)
 
 
-class NoticeHandler(BaseHandler):
+class TypedEventHandler(BaseHandler):
     """
-    通知事件处理器
+    按事件子类型分发的处理器基类（通知、请求事件）
+
+    每个子类型维护一份按注册顺序排列、已合并通用处理器的列表，
+    分发事件时只需一次字典查找。
     """
-    def register(self, notice_type: Optional[str] = None) -> Callable:
+    type_attr = ""  # 事件中表示子类型的属性名
+    handler_label = ""  # 错误提示中的处理器名称
+
+    def __init__(self):
+        super().__init__()
+        self._generic: List[HandlerRecord] = []
+        self._by_type: Dict[str, List[HandlerRecord]] = {}
+
+    def _register(self, event_type: Optional[str]) -> Callable:
         """
-        注册通知处理器
+        注册处理器，event_type 为 None 时处理所有子类型
         """
         def decorator(func: Callable) -> Callable:
             if not inspect.iscoroutinefunction(func):
-                raise SyncHandlerError(f"通知处理器 {func.__name__} 必须是异步函数 (async def).")
-            self.handlers.append({"type": notice_type, "func": func})
+                raise SyncHandlerError(f"{self.handler_label} {func.__name__} 必须是异步函数 (async def).")
+            handler = build_handler_record(func, type=event_type)
+            self.handlers.append(handler)
+            if event_type is None:
+                self._generic.append(handler)
+                for handlers in self._by_type.values():
+                    handlers.append(handler)
+            else:
+                self._by_type.setdefault(event_type, list(self._generic)).append(handler)
             return func
         return decorator
 
     async def handle(self, bot: Bot, event: Any):
         """
-        处理通知事件
+        依次执行该子类型的处理器和通用处理器（按注册顺序）
         """
-        for handler in self.handlers:
-            if handler["type"] is None or handler["type"] == event.notice_type:
-                await self._run_handler(handler["func"], bot, event)
+        for handler in self._by_type.get(getattr(event, self.type_attr), self._generic):
+            await self._run_handler(handler, bot, event)
 
 
-class RequestHandler(BaseHandler):
+class NoticeHandler(TypedEventHandler):
     """
-    请求事件处理器
+    通知事件处理器
     """
-    def register(self, request_type: Optional[str] = None) -> Callable:
+    type_attr = "notice_type"
+    handler_label = "通知处理器"
+
+    def register(self, notice_type: Optional[str] = None) -> Callable:
         """
-        注册请求处理器
+        注册通知处理器
         """
-        def decorator(func: Callable) -> Callable:
-            if not inspect.iscoroutinefunction(func):
-                raise SyncHandlerError(f"请求处理器 {func.__name__} 必须是异步函数 (async def).")
-            self.handlers.append({"type": request_type, "func": func})
-            return func
-        return decorator
+        return self._register(notice_type)
 
-    async def handle(self, bot: Bot, event: Any):
+
+class RequestHandler(TypedEventHandler):
+    """
+    请求事件处理器
+    """
+    type_attr = "request_type"
+    handler_label = "请求处理器"
+
+    def register(self, request_type: Optional[str] = None) -> Callable:
         """
-        处理请求事件
+        注册请求处理器
         """
-        for handler in self.handlers:
-            if handler["type"] is None or handler["type"] == event.request_type:
-                await self._run_handler(handler["func"], bot, event)
+        return self._register(request_type)
@@ -15,6 +15,14 @@ LOG_FORMAT = (
     "<level>{message}</level>"
 )
 
+# 文件日志不着色，使用不含颜色标签的格式，省去标签解析
+FILE_LOG_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss.SSS} | "
+    "{level: <8} | "
+    "{name}:{function}:{line} - "
+    "{message}"
+)
+
 # 移除 loguru 默认的处理器
 logger.remove()
 
@@ -23,8 +31,8 @@ logger.add(
     sys.stderr,
     level="INFO",
     format=LOG_FORMAT,
-    colorize=True,
-    enqueue=True  # 异步写入
+    colorize=sys.stderr.isatty(),  # 输出被重定向时不生成颜色代码
+    # 控制台写入很快，不使用 enqueue，避免每条日志都经过队列转交
 )
 
 # 定义日志文件路径
@@ -36,7 +44,7 @@ log_file_path = log_dir / "{time:YYYY-MM-DD}.log"
 logger.add(
     log_file_path,
     level="DEBUG",
-    format=LOG_FORMAT,
+    format=FILE_LOG_FORMAT,
     colorize=False,
     rotation="00:00",  # 每天午夜创建新文件
     retention="7 days",  # 保留最近 7 天的日志
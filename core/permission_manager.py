@@ -11,11 +11,16 @@
     }
 }
 """
-import json
+import asyncio
 import os
+import time
 from functools import total_ordering
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
+import orjson
+
+from .executor import run_in_thread_pool
 from .logger import logger
 from .admin_manager import admin_manager  # 导入 AdminManager
 
@@ -28,6 +33,8 @@ class Permission:
     封装了权限的名称和等级，并提供了比较方法。
     使用 @total_ordering 装饰器可以自动生成所有的比较运算符。
     """
+    __slots__ = ("name", "level")
+
     def __init__(self, name: str, level: int):
         """
         初始化权限对象
@@ -82,6 +89,9 @@ class PermissionManager:
     """
 
     _instance = None
+    _SAVE_DELAY = 0.5  # 合并写盘的等待时间（秒）
+    _PERM_CACHE_TTL = 60.0  # 用户权限缓存的有效期（秒）
+    _PERM_CACHE_LIMIT = 10000  # 用户权限缓存的条目上限
 
     def __new__(cls):
         """
@@ -116,55 +126,128 @@ class PermissionManager:
         data_dir = os.path.dirname(self.data_file)
         os.makedirs(data_dir, exist_ok=True)
 
-        # 权限数据存储结构：{"users": {"user_id": "level_name"}}
-        self._data: Dict[str, Dict[str, str]] = {"users": {}}
+        # 内存中的权限数据：{user_id: 权限对象}，保存时再转换为 {"users": {"user_id": "level_name"}}
+        self._users: Dict[int, Permission] = {}
+        self._save_task: Optional[asyncio.Task] = None
+        self._dirty = False  # 是否有尚未写入文件的修改
+        self._rendered_users: Optional[Dict[str, str]] = None  # get_all_users 的结果缓存，权限数据变化时清空
 
-        # 加载现有数据
-        self.load()
+        # 用户权限缓存：{user_id: (权限对象, 过期时间)}，管理员集合变化时整体失效
+        self._perm_cache: Dict[int, Tuple[Permission, float]] = {}
+        self._perm_cache_admin_revision = -1
 
         self._initialized = True
         logger.info("权限管理器初始化完成")
 
-    def load(self) -> None:
+    async def initialize(self) -> None:
+        """
+        异步初始化，加载权限数据
+        """
+        await self.load()
+
+    async def load(self) -> None:
         """
         从文件加载权限数据
 
-        如果文件不存在，则创建空文件并初始化默认数据结构。
+        文件读取在线程池中执行。如果文件不存在，则创建空文件并初始化默认数据结构。
         """
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # 兼容旧格式
-                    if "users" in data:
-                        self._data["users"] = data["users"]
-                    else:
-                        self._data["users"] = {}
-                logger.debug(f"权限数据已从 {self.data_file} 加载")
-            else:
-                # 文件不存在，创建空文件
-                self.save()
-                logger.debug(f"创建空的权限数据文件: {self.data_file}")
-        except json.JSONDecodeError as e:
-            logger.error(f"权限数据文件格式错误: {e}")
-            # 文件损坏，重置为空数据
-            self._data["users"] = {}
-            self.save()
+            data = await run_in_thread_pool(self._read_file)
+            raw_users = data.get("users", {}) if isinstance(data, dict) else None
+            if not isinstance(raw_users, dict):
+                raise ValueError("users 字段必须是对象")
+            # 文件中的 QQ 号是字符串键，加载时一次性转换为整数；
+            # 个别条目无效时只跳过该条目，不影响其余数据
+            users: Dict[int, Permission] = {}
+            for user_id, level_name in raw_users.items():
+                try:
+                    uid = int(user_id)
+                except (TypeError, ValueError):
+                    logger.warning(f"跳过无效的 QQ 号: {user_id!r}")
+                    continue
+                permission = _PERMISSIONS.get(level_name)
+                if permission is None:
+                    logger.warning(f"跳过用户 {user_id} 的未知权限等级: {level_name!r}")
+                    continue
+                users[uid] = permission
+            self._users = users
+            self._rendered_users = None
+            self._perm_cache.clear()
+            logger.debug(f"权限数据已从 {self.data_file} 加载")
+        except FileNotFoundError:
+            # 文件不存在，创建空文件
+            await self.save()
+            logger.debug(f"创建空的权限数据文件: {self.data_file}")
+        except (orjson.JSONDecodeError, ValueError) as e:
+            # 不在这里回写文件，保留损坏的原文件以便手动修复
+            logger.error(f"权限数据文件格式错误，已保留原文件: {e}")
+            self._users = {}
+            self._rendered_users = None
+            self._perm_cache.clear()
         except Exception as e:
             logger.error(f"加载权限数据失败: {e}")
-            self._data["users"] = {}
+            self._users = {}
+            self._rendered_users = None
+            self._perm_cache.clear()
 
-    def save(self) -> None:
+    async def save(self) -> None:
         """
-        将权限数据保存到文件
+        将权限数据保存到文件（在线程池中写入）
         """
         try:
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
+            data = {"users": self.get_all_users()}
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            await run_in_thread_pool(self._write_file, payload)
             logger.debug(f"权限数据已保存到 {self.data_file}")
         except Exception as e:
             logger.error(f"保存权限数据失败: {e}")
 
+    def _read_file(self) -> dict:
+        """
+        一次性读取并解析权限数据文件（在线程池中执行）
+        """
+        with open(self.data_file, "rb") as f:
+            return orjson.loads(f.read())
+
+    def _write_file(self, payload: bytes) -> None:
+        """
+        一次性写入临时文件，再原子替换权限数据文件（在线程池中执行）
+        """
+        tmp_file = self.data_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_file, self.data_file)
+
+    def _schedule_save(self) -> None:
+        """
+        安排一次延迟写盘
+
+        等待期间的多次修改会合并为一次文件写入。
+        """
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._delayed_save())
+
+    async def _delayed_save(self) -> None:
+        """
+        等待合并窗口结束后写入权限数据文件
+
+        写盘期间发生的修改会重新标记为未保存，循环直到没有未保存的修改，
+        避免这些修改因写盘任务尚未结束而被遗漏。
+        """
+        while self._dirty:
+            await asyncio.sleep(self._SAVE_DELAY)
+            self._dirty = False
+            await self.save()
+
+    async def close(self) -> None:
+        """
+        等待尚未完成的写盘任务
+        """
+        if self._save_task is not None and not self._save_task.done():
+            # 不取消写盘任务，避免线程池中的写入与新的写入交错
+            await self._save_task
+
     async def get_user_permission(self, user_id: int) -> Permission:
         """
         获取指定用户的权限对象
@@ -175,16 +258,29 @@ class PermissionManager:
         Returns:
             Permission: 用户的权限对象，如果用户不存在则返回默认级别 USER
         """
+        revision = admin_manager.revision
+        if revision != self._perm_cache_admin_revision:
+            self._perm_cache.clear()
+            self._perm_cache_admin_revision = revision
+
+        now = time.monotonic()
+        cached = self._perm_cache.get(user_id)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+
         # 首先，通过 AdminManager 检查是否为管理员
         if await admin_manager.is_admin(user_id):
-            return ADMIN
+            permission = ADMIN
+        else:
+            # 如果不是管理员，则从权限数据中查找
+            permission = self._users.get(user_id, USER)
 
-        # 如果不是管理员，则从 permissions.json 中查找
-        user_id_str = str(user_id)
-        level_name = self._data["users"].get(user_id_str, USER.name)
-        return _PERMISSIONS.get(level_name, USER)
+        if len(self._perm_cache) >= self._PERM_CACHE_LIMIT:
+            self._perm_cache.clear()
+        self._perm_cache[user_id] = (permission, now + self._PERM_CACHE_TTL)
+        return permission
 
-    def set_user_permission(self, user_id: int, permission: Permission) -> None:
+    async def set_user_permission(self, user_id: int, permission: Permission) -> None:
         """
         设置指定用户的权限级别
 
@@ -198,22 +294,24 @@ class PermissionManager:
         if not isinstance(permission, Permission) or permission.name not in _PERMISSIONS:
             raise ValueError(f"无效的权限对象: {permission}")
 
-        user_id_str = str(user_id)
-        self._data["users"][user_id_str] = permission.name
-        self.save()
+        self._users[user_id] = permission
+        self._rendered_users = None
+        self._perm_cache.pop(user_id, None)
+        self._schedule_save()
         logger.info(f"设置用户 {user_id} 的权限级别为 {permission.name}")
 
-    def remove_user(self, user_id: int) -> None:
+    async def remove_user(self, user_id: int) -> None:
         """
         移除指定用户的权限设置，恢复为默认级别
 
         Args:
             user_id (int): 用户 QQ 号
         """
-        user_id_str = str(user_id)
-        if user_id_str in self._data["users"]:
-            del self._data["users"][user_id_str]
-            self.save()
+        if user_id in self._users:
+            del self._users[user_id]
+            self._rendered_users = None
+            self._perm_cache.pop(user_id, None)
+            self._schedule_save()
             logger.info(f"移除用户 {user_id} 的权限设置")
 
     async def check_permission(self, user_id: int, required_permission: Permission) -> bool:
@@ -234,17 +332,35 @@ class PermissionManager:
         """
         获取所有设置了权限的用户及其级别名称
 
+        内部按整数 QQ 号存储，这里转换为与权限数据文件一致的格式后返回。
+        转换结果会缓存到权限数据下一次变化为止，返回的字典是共享的，需要修改时请自行复制。
+
         Returns:
             Dict[str, str]: 用户ID到权限级别名称的映射
         """
-        return self._data["users"].copy()
+        if self._rendered_users is None:
+            self._rendered_users = {str(user_id): p.name for user_id, p in self._users.items()}
+        return self._rendered_users
+
+    def get_all_user_permissions(self) -> Mapping[int, Permission]:
+        """
+        获取所有设置了权限的用户及其权限对象
+
+        返回的是只读视图，不做转换，需要修改时请自行 dict(...) 复制。
+
+        Returns:
+            Mapping[int, Permission]: 用户ID到权限对象的映射
+        """
+        return MappingProxyType(self._users)
 
-    def clear_all(self) -> None:
+    async def clear_all(self) -> None:
         """
         清空所有权限设置
         """
-        self._data["users"].clear()
-        self.save()
+        self._users.clear()
+        self._rendered_users = None
+        self._perm_cache.clear()
+        self._schedule_save()
         logger.info("已清空所有权限设置")
 
 
@@ -9,6 +9,7 @@ import json
 import os
 import pkgutil
 import sys
+from types import MappingProxyType
 
 from core.command_manager import matcher
 from core.exceptions import SyncHandlerError
@@ -47,7 +48,7 @@ def load_all_plugins():
             # 提取插件元数据
             if hasattr(module, "__plugin_meta__"):
                 meta = getattr(module, "__plugin_meta__")
-                matcher.plugins[full_module_name] = meta
+                matcher.register_plugin_meta(full_module_name, meta)
 
             type_str = "包" if is_pkg else "文件"
             logger.success(f"   [{type_str}] 成功{action}: {module_name}")
@@ -123,4 +124,5 @@ class PluginDataManager:
         await self.save()
 
     def get_all(self):
-        return self.data.copy()
+        """获取所有配置项的只读视图，需要修改时请自行 dict(...) 复制"""
+        return MappingProxyType(self.data)
@@ -1,4 +1,5 @@
 import redis.asyncio as redis
+from redis.exceptions import ConnectionError as RedisConnectionError
 from .config_loader import global_config as config
 from .logger import logger
 
@@ -8,6 +9,8 @@ class RedisManager:
     """
     _instance = None
     _redis = None
+    _cache = None
+    _pubsub_client = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -27,23 +30,45 @@ class RedisManager:
                 
                 logger.info(f"正在尝试连接 Redis: {host}:{port}, DB: {db}")
 
-                self._redis = redis.Redis(
+                # 安装 hiredis 后 redis-py 会自动使用其 C 解析器
+                # 连接池占满时使用 BlockingConnectionPool 排队等待空闲连接，而不是直接抛出 "Too many connections"
+                pool_kwargs = dict(
                     host=host,
                     port=port,
                     db=db,
                     password=password,
-                    decode_responses=True
+                    max_connections=config.redis.get('max_connections', 20),
+                    timeout=config.redis.get('pool_timeout', 20),
+                    socket_connect_timeout=config.redis.get('socket_connect_timeout', 1),
+                )
+                # 供插件使用的共享客户端，读取到的值为 str
+                # 不设置命令超时，插件中的 BLPOP、XREAD BLOCK 或耗时较长的 Lua 脚本不会被中断
+                self._redis = redis.Redis(
+                    connection_pool=redis.BlockingConnectionPool(decode_responses=True, **pool_kwargs)
+                )
+                # API 缓存专用客户端，直接读写 orjson 编码的 bytes，省去解码
+                # 缓存命令都很短，设置命令超时以免 Redis 卡顿时拖住 API 调用
+                self._cache = redis.Redis(
+                    connection_pool=redis.BlockingConnectionPool(
+                        decode_responses=False,
+                        socket_timeout=config.redis.get('socket_timeout', 2),
+                        **pool_kwargs,
+                    )
+                )
+                # 订阅连接会长时间阻塞等待消息，同样不能使用命令超时
+                self._pubsub_client = redis.Redis(
+                    connection_pool=redis.BlockingConnectionPool(decode_responses=True, **pool_kwargs)
                 )
                 if await self._redis.ping():
                     logger.success("Redis 连接成功！")
                 else:
                     logger.error("Redis 连接失败: PING 命令无响应")
-            except redis.exceptions.ConnectionError as e:
+            except RedisConnectionError as e:
                 logger.error(f"Redis 连接失败: {e}")
-                self._redis = None
+                self._redis = self._cache = self._pubsub_client = None
             except Exception as e:
                 logger.exception(f"Redis 初始化时发生未知错误: {e}")
-                self._redis = None
+                self._redis = self._cache = self._pubsub_client = None
 
     @property
     def redis(self):
@@ -54,5 +79,22 @@ class RedisManager:
             raise ConnectionError("Redis 未初始化或连接失败，请先调用 initialize()")
         return self._redis
 
+    @property
+    def cache(self):
+        """
+        获取 API 缓存专用的 Redis 连接实例（不解码响应，读取到的值为 bytes）
+        """
+        if self._cache is None:
+            raise ConnectionError("Redis 未初始化或连接失败，请先调用 initialize()")
+        return self._cache
+
+    def pubsub(self):
+        """
+        创建一个发布/订阅对象，使用不设命令超时的独立连接池
+        """
+        if self._pubsub_client is None:
+            raise ConnectionError("Redis 未初始化或连接失败，请先调用 initialize()")
+        return self._pubsub_client.pubsub()
+
 # 全局 Redis 管理器实例
 redis_manager = RedisManager()
@@ -12,12 +12,16 @@ WebSocket 连接。它是整个机器人框架的底层通信基础。
 - 提供 `call_api` 方法，用于异步发送 API 请求并等待响应。
 """
 import asyncio
-import json
+import random
+import socket
+import time
 import traceback
-import uuid
 from datetime import datetime
+from types import MappingProxyType
 
+import orjson
 import websockets
+from websockets.protocol import State
 
 from models import EventFactory
 
@@ -26,12 +30,33 @@ from .command_manager import matcher
 from .config_loader import global_config
 from .logger import logger
 
+# 仅 Linux 提供 TCP_CORK，其他平台不做报文合并
+_TCP_CORK = getattr(socket, "TCP_CORK", None)
+
+def _json_default(obj):
+    """
+    orjson 无法直接序列化的类型的转换函数，只在遇到这些类型时才会被调用。
+
+    共享的消息段（如 `MessageSegment.at`）使用只读的 MappingProxyType 保存数据。
+    """
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError
+
+
+# 预扫描原始消息时查找的字段名（文本帧为 str，二进制帧为 bytes）
+_FRAME_KEYS_STR = ('"post_type"', '"echo"')
+_FRAME_KEYS_BYTES = (b'"post_type"', b'"echo"')
+
 
 class WS:
     """
     WebSocket 客户端，负责与 OneBot v11 实现进行底层通信。
     """
 
+    BAD_FRAME_LOG_INTERVAL = 10.0  # 无法解析消息的警告最短间隔（秒）
+    API_TIMEOUT = 30.0  # API 请求等待响应的超时时间（秒）
+
     def __init__(self):
         """
         初始化 WebSocket 客户端。
@@ -42,28 +67,62 @@ class WS:
         cfg = global_config.napcat_ws
         self.url = cfg.get("uri")
         self.token = cfg.get("token")
+        # 认证请求头只需构建一次，重连时直接复用
+        self._headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
         self.reconnect_interval = cfg.get("reconnect_interval", 5)
+        self.reconnect_max_interval = cfg.get("reconnect_max_interval", 60)
+        self.event_workers = cfg.get("event_workers", 16)
 
         self.ws = None
         self._pending_requests = {}
+        self._echo_counter = 0  # 自增的 echo 编号，比 uuid 更廉价
+        # 待发送的 API 请求帧：[(payload, echo_id)]，同一轮事件循环内的请求合并发送
+        self._send_buf = []
+        self._flush_task = None
+        # 无法解析消息的计数与上次警告时间，用于限制警告频率
+        self._bad_frames = 0
+        self._bad_frame_logged_at = float("-inf")
+        # 事件队列由固定数量的工作协程消费，避免每个事件都创建一个 Task
+        self._event_queue = asyncio.Queue(maxsize=cfg.get("event_queue_size", 1000))
+        self._overflow_tasks = set()
         self.bot = Bot(self)
 
     async def connect(self):
         """
         启动并管理 WebSocket 连接。
 
-        这是一个无限循环，负责建立连接。如果连接断开，它会根据配置的
-        `reconnect_interval` 时间间隔后自动尝试重新连接。
+        这是一个无限循环，负责建立连接。如果连接断开，它会从配置的
+        `reconnect_interval` 起按指数退避自动尝试重新连接。
+        事件处理工作协程在此启动，并在退出时取消。
         """
-        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        workers = [
+            asyncio.create_task(self._event_worker())
+            for _ in range(self.event_workers)
+        ]
+        try:
+            await self._reconnect_loop()
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _reconnect_loop(self):
+        """
+        建立连接，并在断开后重连。
 
+        重连间隔从 `reconnect_interval` 开始，连续失败时指数增长，
+        最长为 `reconnect_max_interval`，并加入 ±25% 的随机抖动，
+        避免多个实例在服务端恢复时同时重连。连接成功后重新计数。
+        """
+        attempt = 0
         while True:
             try:
                 logger.info(f"正在尝试连接至 NapCat: {self.url}")
                 async with websockets.connect(
-                    self.url, additional_headers=headers
+                    self.url, additional_headers=self._headers
                 ) as websocket:
                     self.ws = websocket
+                    self._set_nodelay(websocket)
+                    attempt = 0
                     logger.success("连接成功！")
                     await self._listen_loop(websocket)
 
@@ -75,8 +134,29 @@ class WS:
             except Exception as e:
                 logger.exception(f"运行异常: {e}")
 
-            logger.info(f"{self.reconnect_interval}秒后尝试重连...")
-            await asyncio.sleep(self.reconnect_interval)
+            delay = min(self.reconnect_interval * 2 ** attempt, self.reconnect_max_interval)
+            delay *= random.uniform(0.75, 1.25)
+            attempt += 1
+            logger.info(f"{delay:.1f}秒后尝试重连...")
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _set_nodelay(websocket):
+        """
+        为连接的套接字开启 TCP_NODELAY，避免 Nagle 算法延迟小的 API 请求帧。
+
+        asyncio 的 TCP 传输默认已开启该选项，这里显式设置以确保不受事件循环实现影响。
+
+        Args:
+            websocket: 当前活动的 WebSocket 连接对象。
+        """
+        sock = websocket.transport.get_extra_info("socket")
+        if sock is None or sock.family not in (socket.AF_INET, socket.AF_INET6):
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.debug(f"设置 TCP_NODELAY 失败: {e}")
 
     async def _listen_loop(self, websocket):
         """
@@ -88,27 +168,97 @@ class WS:
         Args:
             websocket: 当前活动的 WebSocket 连接对象。
         """
+        pending_requests = self._pending_requests
         async for message in websocket:
+            # 先在原始文本中查找关键字段，既不是 API 响应也不是事件的消息无需解析
+            # 子串误判（例如字段名出现在字符串值中）只会导致照常解析，不影响正确性
+            post_type_key, echo_key = _FRAME_KEYS_STR if type(message) is str else _FRAME_KEYS_BYTES
+            if post_type_key not in message and echo_key not in message:
+                continue
             try:
-                data = json.loads(message)
-
-                # 1. 处理 API 响应
-                # 如果消息中包含 echo 字段，说明是 API 调用的响应
-                echo_id = data.get("echo")
-                if echo_id and echo_id in self._pending_requests:
-                    future = self._pending_requests.pop(echo_id)
+                data = orjson.loads(message)
+            except orjson.JSONDecodeError as e:
+                self._warn_bad_frame(f"JSON 解析失败: {e}")
+                continue
+            if type(data) is not dict:
+                if type(data) is list:
+                    # 批量上报的事件数组：整体只解析一次，再逐个放入事件队列
+                    self._dispatch_event_batch(data)
+                else:
+                    self._warn_bad_frame(f"消息不是 JSON 对象: {type(data).__name__}")
+                continue
+
+            # 1. 处理 API 响应
+            # 如果消息中包含 echo 字段，说明是 API 调用的响应
+            echo_id = data.get("echo")
+            if echo_id is not None:
+                # 兼容实现端将 echo 以数字形式返回的情况
+                future = pending_requests.pop(str(echo_id), None)
+                if future is not None:
                     if not future.done():
                         future.set_result(data)
                     continue
 
-                # 2. 处理上报事件
-                # 如果消息中包含 post_type 字段，说明是 OneBot 上报的事件
-                if "post_type" in data:
-                    # 使用 create_task 异步执行，避免阻塞 WebSocket 接收循环
-                    asyncio.create_task(self.on_event(data))
+            # 2. 处理上报事件
+            # 如果消息中包含 post_type 字段，说明是 OneBot 上报的事件
+            if "post_type" in data:
+                self._dispatch_event(data)
 
-            except Exception as e:
-                logger.exception(f"解析消息异常: {e}")
+    def _warn_bad_frame(self, reason: str):
+        """
+        记录无法解析的消息，限制频率，避免异常消息刷屏。
+
+        每个 `BAD_FRAME_LOG_INTERVAL` 秒内最多输出一条警告，并附带期间被忽略的条数。
+
+        Args:
+            reason (str): 无法解析的原因。
+        """
+        self._bad_frames += 1
+        now = time.monotonic()
+        if now - self._bad_frame_logged_at < self.BAD_FRAME_LOG_INTERVAL:
+            return
+        logger.warning(f"忽略 {self._bad_frames} 条无法解析的消息，最近一条: {reason}")
+        self._bad_frames = 0
+        self._bad_frame_logged_at = now
+
+    def _dispatch_event(self, data: dict):
+        """
+        将事件放入事件队列，由工作协程异步处理，不阻塞 WebSocket 接收循环。
+
+        队列已满时不能等待：处理器可能正在等待 API 响应，而响应需要接收循环读取，
+        等待会造成死锁。此时退回为单独创建 Task 处理该事件。
+
+        Args:
+            data (dict): 原始事件字典。
+        """
+        try:
+            self._event_queue.put_nowait(data)
+        except asyncio.QueueFull:
+            task = asyncio.create_task(self.on_event(data))
+            self._overflow_tasks.add(task)
+            task.add_done_callback(self._overflow_tasks.discard)
+
+    def _dispatch_event_batch(self, items: list):
+        """
+        分发批量上报的事件数组，数组中不是事件的元素按无法解析的消息处理。
+
+        Args:
+            items (list): 原始事件字典组成的列表。
+        """
+        for data in items:
+            if type(data) is dict and "post_type" in data:
+                self._dispatch_event(data)
+            else:
+                self._warn_bad_frame("事件数组中包含非事件元素")
+
+    async def _event_worker(self):
+        """
+        事件工作协程，持续从事件队列中取出事件并处理。
+        """
+        queue = self._event_queue
+        while True:
+            data = await queue.get()
+            await self.on_event(data)
 
     async def on_event(self, raw_data: dict):
         """
@@ -129,16 +279,17 @@ class WS:
             event.bot = self.bot  # 注入 Bot 实例
 
             # 打印日志
-            if event.post_type == "message":
+            # 使用 loguru 的参数格式化，没有处理器接收该级别时不会拼接字符串
+            post_type = event.post_type
+            if post_type == "message":
                 sender_name = event.sender.nickname if event.sender else "Unknown"
-                logger.info(f"[消息] {event.message_type} | {event.user_id}({sender_name}): {event.raw_message}")
-            elif event.post_type == "notice":
-                logger.info(f"[通知] {event.notice_type}")
-            elif event.post_type == "request":
-                logger.info(f"[请求] {event.request_type}")
-            elif event.post_type == "meta_event":
-                logger.debug(f"[元事件] {event.meta_event_type}")
-
+                logger.info("[消息] {} | {}({}): {}", event.message_type, event.user_id, sender_name, event.raw_message)
+            elif post_type == "notice":
+                logger.info("[通知] {}", event.notice_type)
+            elif post_type == "request":
+                logger.info("[请求] {}", event.request_type)
+            elif post_type == "meta_event":
+                logger.debug("[元事件] {}", event.meta_event_type)
 
             # 分发事件
             await matcher.handle_event(self.bot, event)
@@ -165,25 +316,86 @@ class WS:
             logger.error("调用 API 失败: WebSocket 未初始化")
             return {"status": "failed", "msg": "websocket not initialized"}
 
-        from websockets.protocol import State
-
-        if getattr(self.ws, "state", None) is not State.OPEN:
+        if self.ws.state is not State.OPEN:
             logger.error("调用 API 失败: WebSocket 连接未打开")
             return {"status": "failed", "msg": "websocket is not open"}
 
-        echo_id = str(uuid.uuid4())
+        self._echo_counter += 1
+        echo_id = str(self._echo_counter)
         payload = {"action": action, "params": params or {}, "echo": echo_id}
 
         loop = asyncio.get_running_loop()
         future = loop.create_future()
         self._pending_requests[echo_id] = future
 
-        await self.ws.send(json.dumps(payload))
+        # 放入发送缓冲区，由发送任务在下一轮事件循环中统一发送
+        self._send_buf.append((orjson.dumps(payload, default=_json_default), echo_id))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_send())
 
+        # 超时由一个定时回调完成 Future，不再为每次调用创建 wait_for 的包装任务
+        timer = loop.call_later(self.API_TIMEOUT, self._timeout_request, echo_id, action, params)
         try:
-            return await asyncio.wait_for(future, timeout=30.0)
-        except asyncio.TimeoutError:
+            return await future
+        finally:
+            timer.cancel()
+            # 调用方被取消时清理等待中的请求
             self._pending_requests.pop(echo_id, None)
-            logger.warning(f"API 调用超时: action={action}, params={params}")
-            return {"status": "failed", "retcode": -1, "msg": "api timeout"}
 
+    def _timeout_request(self, echo_id: str, action: str, params: dict):
+        """
+        API 请求超时的回调，以失败响应完成对应的 Future。
+
+        Args:
+            echo_id (str): 请求的 echo 编号。
+            action (str): API 的动作名称。
+            params (dict): API 请求的参数字典。
+        """
+        future = self._pending_requests.pop(echo_id, None)
+        if future is None or future.done():
+            return
+        logger.warning(f"API 调用超时: action={action}, params={params}")
+        future.set_result({"status": "failed", "retcode": -1, "msg": "api timeout"})
+
+    async def _flush_send(self):
+        """
+        发送缓冲区中累积的所有 API 请求帧。
+
+        同一轮事件循环内发起的多个请求会被一次性连续发送；在 Linux 上发送期间
+        开启 TCP_CORK，让内核把这些小帧合并成尽量少的 TCP 报文段。
+        发送失败时，将异常传递给对应请求的 Future。
+        """
+        while self._send_buf:
+            batch, self._send_buf = self._send_buf, []
+            websocket = self.ws
+            sock = None
+            if len(batch) > 1 and _TCP_CORK is not None:
+                sock = websocket.transport.get_extra_info("socket")
+            self._set_cork(sock, 1)
+            try:
+                for i, (payload, echo_id) in enumerate(batch):
+                    # orjson 直接输出 UTF-8 字节，以文本帧发送，省去一次解码
+                    await websocket.send(payload, text=True)
+            except Exception as e:
+                for _, failed_echo in batch[i:]:
+                    future = self._pending_requests.pop(failed_echo, None)
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+            finally:
+                self._set_cork(sock, 0)
+
+    @staticmethod
+    def _set_cork(sock, value: int):
+        """
+        设置套接字的 TCP_CORK 选项，sock 为 None 时不做任何操作。
+
+        Args:
+            sock: 连接的套接字。
+            value (int): 1 表示开启，0 表示关闭（并立即发出已缓存的数据）。
+        """
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, value)
+        except OSError:
+            pass
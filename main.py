@@ -5,19 +5,26 @@ NEO Bot 主程序入口
 """
 import asyncio
 import os
-import time
+from typing import Optional
 
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+try:
+    # uvloop 基于 libuv，可显著加快 WebSocket 收发和任务调度；不支持 Windows，缺失时回退到默认事件循环
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # 初始化日志系统，必须在其他 core 模块导入之前执行
 from core.logger import logger
 
 from core.admin_manager import admin_manager
+from core.permission_manager import permission_manager
 from core.ws import WS
 from core.plugin_manager import load_all_plugins
 from core.redis_manager import redis_manager
-from core.executor import run_in_thread_pool
+from core.executor import executor, run_in_thread_pool
 
 
 class PluginReloadHandler(FileSystemEventHandler):
@@ -26,19 +33,25 @@ class PluginReloadHandler(FileSystemEventHandler):
 
     继承自 watchdog.events.FileSystemEventHandler，
     监听 base_plugins 目录下的文件变化，并触发插件重载。
+
+    watchdog 在自己的线程中回调，这里只把事件转交给事件循环；
+    事件循环中使用尾沿防抖，一批连续的文件变更只触发一次重载。
     """
-    def __init__(self):
+    def __init__(self, loop: asyncio.AbstractEventLoop):
         """
         初始化处理器
-        
-        设置冷却时间，防止短时间内多次触发重载。
+
+        :param loop: 执行重载任务的事件循环
         """
-        self.last_reload_time = 0
-        self.cooldown = 1.0  # 冷却时间，防止短时间内多次重载
+        self.loop = loop
+        self.debounce = 0.5  # 最后一次变更后等待的时间（秒），期间的新变更会重新计时
+        self._pending_timer: Optional[asyncio.TimerHandle] = None
+        self._reload_task: Optional[asyncio.Task] = None
+        self._rerun = False  # 重载进行中又有新的变更，结束后需再重载一次
 
     def on_any_event(self, event):
         """
-        处理所有文件事件
+        处理所有文件事件（在 watchdog 线程中调用）
 
         :param event: watchdog 事件对象
         """
@@ -53,22 +66,43 @@ class PluginReloadHandler(FileSystemEventHandler):
         if "__pycache__" in event.src_path:
             return
 
-        # 简单的防抖动
-        current_time = time.time()
-        if current_time - self.last_reload_time < self.cooldown:
+        self.loop.call_soon_threadsafe(self._schedule_reload, event.src_path)
+
+    def _schedule_reload(self, src_path: str):
+        """
+        （重新）安排一次延迟重载，在事件循环中调用
+
+        :param src_path: 发生变更的文件路径
+        """
+        logger.info(f"检测到文件变更: {src_path}")
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+        self._pending_timer = self.loop.call_later(self.debounce, self._start_reload)
+
+    def _start_reload(self):
+        """
+        防抖结束，启动重载任务；已有重载在进行时，等它结束后再重载一次
+        """
+        self._pending_timer = None
+        if self._reload_task is not None and not self._reload_task.done():
+            self._rerun = True
             return
-        
-        self.last_reload_time = current_time
-        
-        logger.info(f"检测到文件变更: {event.src_path}")
-        logger.info("正在重载插件...")
-        
-        try:
-            # 重新扫描并加载插件
-            run_in_thread_pool(load_all_plugins)
-            logger.success("插件重载完成")
-        except Exception as e:
-            logger.exception(f"重载失败: {e}")
+        self._reload_task = self.loop.create_task(self._reload())
+
+    async def _reload(self):
+        """
+        在线程池中重新扫描并加载插件
+        """
+        while True:
+            self._rerun = False
+            logger.info("正在重载插件...")
+            try:
+                await run_in_thread_pool(load_all_plugins)
+                logger.success("插件重载完成")
+            except Exception as e:
+                logger.exception(f"重载失败: {e}")
+            if not self._rerun:
+                return
 
 
 @logger.catch
@@ -80,6 +114,9 @@ async def main():
     2. 初始化 WebSocket 客户端
     3. 建立连接并保持运行
     """
+    # 使用全局线程池作为事件循环的默认执行器
+    asyncio.get_running_loop().set_default_executor(executor)
+
     # 首次加载插件
     await run_in_thread_pool(load_all_plugins)
 
@@ -89,11 +126,14 @@ async def main():
     # 初始化管理员管理器
     await admin_manager.initialize()
 
+    # 加载权限数据
+    await permission_manager.initialize()
+
     # 启动文件监控
     # 监控 plugins 目录
     plugin_path = os.path.join(os.path.dirname(__file__), "plugins")
     
-    event_handler = PluginReloadHandler()
+    event_handler = PluginReloadHandler(asyncio.get_running_loop())
     observer = Observer()
     
     if os.path.exists(plugin_path):
@@ -110,7 +150,12 @@ async def main():
         if observer.is_alive():
             observer.stop()
             observer.join()
+        await admin_manager.close()
+        await permission_manager.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
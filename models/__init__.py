@@ -23,13 +23,20 @@ from .events.notice import (
     GroupUploadNoticeEvent,
     HonorNotifyEvent,
     LuckyKingNotifyEvent,
+    NOTICE_EVENT_CLASSES,
+    NOTIFY_EVENT_CLASSES,
     NoticeEvent,
     NotifyNoticeEvent,
     OfflineFile,
     OfflineFileNoticeEvent,
     PokeNotifyEvent,
 )
-from .events.request import FriendRequestEvent, GroupRequestEvent, RequestEvent
+from .events.request import (
+    REQUEST_EVENT_CLASSES,
+    FriendRequestEvent,
+    GroupRequestEvent,
+    RequestEvent,
+)
 from .objects import (
     CurrentTalkative,
     EssenceMessage,
@@ -37,8 +44,12 @@ from .objects import (
     GroupHonorInfo,
     GroupInfo,
     GroupMemberInfo,
+    GroupMemberTable,
     HonorInfo,
     LoginInfo,
+    ROLE_ADMIN,
+    ROLE_MEMBER,
+    ROLE_OWNER,
     Status,
     StrangerInfo,
     VersionInfo,
@@ -75,9 +86,12 @@ __all__ = [
     "ClientStatusNoticeEvent",
     "ClientStatus",
     "EssenceNoticeEvent",
+    "NOTICE_EVENT_CLASSES",
+    "NOTIFY_EVENT_CLASSES",
     "RequestEvent",
     "FriendRequestEvent",
     "GroupRequestEvent",
+    "REQUEST_EVENT_CLASSES",
     "MetaEvent",
     "HeartbeatEvent",
     "LifeCycleEvent",
@@ -85,6 +99,10 @@ __all__ = [
     "EventFactory",
     "GroupInfo",
     "GroupMemberInfo",
+    "GroupMemberTable",
+    "ROLE_OWNER",
+    "ROLE_ADMIN",
+    "ROLE_MEMBER",
     "FriendInfo",
     "StrangerInfo",
     "LoginInfo",
@@ -4,9 +4,11 @@
 该模块定义了所有 OneBot v11 事件模型的基类 `OneBotEvent` 和
 事件类型常量 `EventType`。所有具体的事件模型都应继承自 `OneBotEvent`。
 """
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional
-from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, ClassVar, Optional
+from abc import ABC
 
 if TYPE_CHECKING:
     from core.bot import Bot
@@ -35,7 +37,7 @@ class OneBotEvent(ABC):
     """
     OneBot v11 事件的抽象基类。
 
-    所有具体的事件模型都必须继承此类，并实现 `post_type` 属性。
+    所有具体的事件模型都必须继承此类，并设置 `post_type` 类属性。
 
     Attributes:
         time (int): 事件发生的时间戳 (秒)。
@@ -47,16 +49,13 @@ class OneBotEvent(ABC):
     self_id: int
     _bot: Optional["Bot"] = field(default=None, init=False)
 
-    @property
-    @abstractmethod
-    def post_type(self) -> str:
-        """
-        抽象属性，代表事件的上报类型。
+    post_type: ClassVar[str]
+    """
+    事件的上报类型，为类属性而非数据类字段。
 
-        子类必须重写此属性，并返回对应的 `EventType` 常量值。
-        例如: `return EventType.MESSAGE`
-        """
-        pass
+    子类必须将其设置为对应的 `EventType` 常量值。
+    例如: `post_type: ClassVar[str] = EventType.MESSAGE`
+    """
 
     @property
     def bot(self) -> "Bot":
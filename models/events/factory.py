@@ -3,28 +3,306 @@
 
 用于根据 JSON 数据创建对应的事件对象。
 """
-from typing import Any, Dict
+from dataclasses import MISSING, fields
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from models.message import MessageSegment
 from models.sender import Sender
 from .base import OneBotEvent, EventType
 from .message import GroupMessageEvent, PrivateMessageEvent, Anonymous
 from .notice import (
-    NoticeEvent, FriendAddNoticeEvent, FriendRecallNoticeEvent,
-    GroupRecallNoticeEvent, GroupIncreaseNoticeEvent,
-    GroupDecreaseNoticeEvent, GroupAdminNoticeEvent, GroupBanNoticeEvent,
-    GroupUploadNoticeEvent, GroupUploadFile,
-    NotifyNoticeEvent, PokeNotifyEvent, LuckyKingNotifyEvent, HonorNotifyEvent,
-    GroupCardNoticeEvent, OfflineFileNoticeEvent, OfflineFile,
-    ClientStatusNoticeEvent, ClientStatus, EssenceNoticeEvent
+    NoticeEvent, GroupUploadNoticeEvent, GroupUploadFile, NotifyNoticeEvent,
+    OfflineFileNoticeEvent, OfflineFile, ClientStatusNoticeEvent, ClientStatus,
+    NOTICE_EVENT_CLASSES, NOTIFY_EVENT_CLASSES
 )
-from .request import RequestEvent, FriendRequestEvent, GroupRequestEvent
+from .request import RequestEvent, REQUEST_EVENT_CLASSES
 from .meta import MetaEvent, HeartbeatEvent, LifeCycleEvent, HeartbeatStatus
 
 
+# 事件构建函数统一签名：(data) -> OneBotEvent
+# 构建时按数据类字段顺序使用位置参数，避免关键字参数绑定和字典合并
+_Builder = Callable[[Dict[str, Any]], OneBotEvent]
+
+_LITERAL_TYPES = (int, str, bool, float, type(None))
+
+
+def _compile_builder(cls: type, fixed: Dict[str, Any], read: Dict[str, Any]) -> _Builder:
+    """
+    为只包含简单字段的事件类生成专用的构建函数
+
+    生成的函数通过 `cls.__new__` 创建对象并逐个写入字段，
+    不经过数据类 `__init__` 的关键字参数绑定。
+
+    :param cls: 事件类
+    :param fixed: 取固定值的字段，如 {"notice_type": "friend_add"}
+    :param read: 从事件数据中读取的字段及其缺省值，字段名即数据中的键名
+    :return: 签名为 (data) 的构建函数
+    :raises TypeError: 如果某个字段既没有给出取值方式，也没有简单的默认值
+    """
+    namespace: Dict[str, Any] = {"_cls": cls, "_new": cls.__new__}
+
+    def literal(name: str, value: Any) -> str:
+        # 简单字面量直接写入源码，其他值通过命名空间传入
+        if type(value) in _LITERAL_TYPES:
+            return repr(value)
+        key = f"_v_{name}"
+        namespace[key] = value
+        return key
+
+    lines = [
+        "def build(data):",
+        "    g = data.get",
+        "    obj = _new(_cls)",
+    ]
+    for f in fields(cls):
+        name = f.name
+        if name in ("time", "self_id"):
+            value = f"g({name!r}, 0)"
+        elif name in fixed:
+            value = literal(name, fixed[name])
+        elif name in read:
+            value = f"g({name!r}, {literal(name, read[name])})"
+        elif f.default is not MISSING:
+            value = literal(name, f.default)
+        else:
+            raise TypeError(f"{cls.__name__}.{name} 缺少取值方式")
+        lines.append(f"    obj.{name} = {value}")
+    lines.append("    return obj")
+
+    exec("\n".join(lines), namespace)
+    build = namespace["build"]
+    build.__name__ = build.__qualname__ = f"_build_{cls.__name__}"
+    return build
+
+
+# --- 消息事件 ---
+
+@lru_cache(maxsize=4096)
+def _get_sender(
+    user_id: int,
+    nickname: str,
+    sex: str,
+    age: int,
+    card: Optional[str],
+    area: Optional[str],
+    level: Optional[str],
+    role: Optional[str],
+    title: Optional[str],
+) -> Sender:
+    """
+    获取发送者对象，字段完全相同时复用缓存的不可变实例
+
+    同一用户在群里连续发言时，发送者信息几乎不变，无需每条消息都新建对象。
+    """
+    return Sender(user_id, nickname, sex, age, card, area, level, role, title)
+
+
+def _build_private_message(data: Dict[str, Any], base: Tuple[Any, ...]) -> OneBotEvent:
+    return PrivateMessageEvent(*base)
+
+
+def _build_group_message(data: Dict[str, Any], base: Tuple[Any, ...]) -> OneBotEvent:
+    anonymous_data = data.get("anonymous")
+    anonymous = None
+    if anonymous_data:
+        ag = anonymous_data.get
+        anonymous = Anonymous(ag("id", 0), ag("name", ""), ag("flag", ""))
+    return GroupMessageEvent(*base, data.get("group_id", 0), anonymous)
+
+
+# 消息事件构建函数额外接收 MessageEvent 公共字段组成的元组
+_MESSAGE_BUILDERS: Dict[str, Callable[[Dict[str, Any], Tuple[Any, ...]], OneBotEvent]] = {
+    "private": _build_private_message,
+    "group": _build_group_message,
+}
+
+
+def _build_message(data: Dict[str, Any]) -> OneBotEvent:
+    g = data.get
+    message_type = g("message_type")
+    build = _MESSAGE_BUILDERS.get(message_type)
+    if build is None:
+        # 未知消息类型，抛出异常
+        raise ValueError(f"Unknown message type: {message_type}")
+
+    # 解析消息段
+    # data 刚由 orjson 解析出来，没有其他引用，直接包装为只读映射而不复制
+    raw_message_list = g("message")
+    if type(raw_message_list) is list:
+        message_list = [
+            MessageSegment._from_event(item.get("type", ""), item.get("data"))
+            for item in raw_message_list
+            if type(item) is dict
+        ]
+    else:
+        message_list = []
+
+    # 解析发送者
+    sg = g("sender", {}).get
+    sender_fields = (
+        sg("user_id", 0),
+        sg("nickname", ""),
+        sg("sex", "unknown"),
+        sg("age", 0),
+        sg("card"),
+        sg("area"),
+        sg("level"),
+        sg("role"),
+        sg("title"),
+    )
+    try:
+        sender = _get_sender(*sender_fields)
+    except TypeError:
+        # 实现端上报了不可哈希的字段值，无法缓存，直接创建
+        sender = Sender(*sender_fields)
+
+    # 顺序与 MessageEvent 的字段一致
+    base = (
+        g("time", 0),
+        g("self_id", 0),
+        message_type,
+        g("sub_type", ""),
+        g("message_id", 0),
+        g("user_id", 0),
+        message_list,
+        g("raw_message", ""),
+        g("font", 0),
+        sender,
+    )
+    return build(data, base)
+
+
+# --- 通知事件 ---
+
+def _build_group_upload(data: Dict[str, Any]) -> OneBotEvent:
+    g = data.get
+    fg = g("file", {}).get
+    file = GroupUploadFile(fg("id", ""), fg("name", ""), fg("size", 0), fg("busid", 0))
+    return GroupUploadNoticeEvent(
+        g("time", 0), g("self_id", 0), "group_upload",
+        g("group_id", 0), g("user_id", 0), file
+    )
+
+
+def _build_generic_notify(data: Dict[str, Any]) -> OneBotEvent:
+    g = data.get
+    return NotifyNoticeEvent(
+        g("time", 0), g("self_id", 0), "notify",
+        g("sub_type", ""), g("user_id", 0)
+    )
+
+
+# notify 子类型 -> 从事件数据中读取的字段及缺省值
+_NOTIFY_FIELDS: Dict[str, Dict[str, Any]] = {
+    "poke": {"user_id": 0, "target_id": 0, "group_id": 0},
+    "lucky_king": {"user_id": 0, "group_id": 0, "target_id": 0},
+    "honor": {"user_id": 0, "group_id": 0, "honor_type": ""},
+}
+
+_NOTIFY_BUILDERS: Dict[str, _Builder] = {
+    sub_type: _compile_builder(
+        NOTIFY_EVENT_CLASSES[sub_type],
+        {"notice_type": "notify", "sub_type": sub_type},
+        read,
+    )
+    for sub_type, read in _NOTIFY_FIELDS.items()
+}
+
+
+def _build_notify(data: Dict[str, Any]) -> OneBotEvent:
+    return _NOTIFY_BUILDERS.get(data.get("sub_type", ""), _build_generic_notify)(data)
+
+
+def _build_offline_file(data: Dict[str, Any]) -> OneBotEvent:
+    g = data.get
+    fg = g("file", {}).get
+    file = OfflineFile(fg("name", ""), fg("size", 0), fg("url", ""))
+    return OfflineFileNoticeEvent(
+        g("time", 0), g("self_id", 0), "offline_file",
+        g("user_id", 0), file
+    )
+
+
+def _build_client_status(data: Dict[str, Any]) -> OneBotEvent:
+    g = data.get
+    cg = g("client", {}).get
+    client = ClientStatus(cg("online", False), cg("status", ""))
+    return ClientStatusNoticeEvent(g("time", 0), g("self_id", 0), "client_status", client)
+
+
+# 只含简单字段的通知类型 -> 从事件数据中读取的字段及缺省值，这些类型使用生成的构建函数
+_NOTICE_FIELDS: Dict[str, Dict[str, Any]] = {
+    "friend_add": {"user_id": 0},
+    "friend_recall": {"user_id": 0, "message_id": 0},
+    "group_recall": {"group_id": 0, "user_id": 0, "operator_id": 0, "message_id": 0},
+    "group_increase": {"group_id": 0, "user_id": 0, "operator_id": 0, "sub_type": ""},
+    "group_decrease": {"group_id": 0, "user_id": 0, "operator_id": 0, "sub_type": ""},
+    "group_admin": {"group_id": 0, "user_id": 0, "sub_type": ""},
+    "group_ban": {"group_id": 0, "user_id": 0, "operator_id": 0, "duration": 0, "sub_type": ""},
+    "group_card": {"group_id": 0, "user_id": 0, "card_new": "", "card_old": ""},
+    "essence": {"sub_type": "", "group_id": 0, "sender_id": 0, "operator_id": 0, "message_id": 0},
+}
+
+_NOTICE_BUILDERS: Dict[str, _Builder] = {
+    notice_type: _compile_builder(
+        NOTICE_EVENT_CLASSES[notice_type],
+        {"notice_type": notice_type},
+        read,
+    )
+    for notice_type, read in _NOTICE_FIELDS.items()
+}
+# 包含嵌套对象的通知使用手写的构建函数
+_NOTICE_BUILDERS.update({
+    "group_upload": _build_group_upload,
+    "notify": _build_notify,
+    "offline_file": _build_offline_file,
+    "client_status": _build_client_status,
+})
+
+
+# --- 请求事件 ---
+
+# 请求类型 -> 从事件数据中读取的字段及缺省值
+_REQUEST_FIELDS: Dict[str, Dict[str, Any]] = {
+    "friend": {"user_id": 0, "comment": "", "flag": ""},
+    "group": {"sub_type": "", "group_id": 0, "user_id": 0, "comment": "", "flag": ""},
+}
+
+_REQUEST_BUILDERS: Dict[str, _Builder] = {
+    request_type: _compile_builder(
+        REQUEST_EVENT_CLASSES[request_type],
+        {"request_type": request_type},
+        read,
+    )
+    for request_type, read in _REQUEST_FIELDS.items()
+}
+
+
+# --- 元事件 ---
+
+def _build_heartbeat(data: Dict[str, Any]) -> OneBotEvent:
+    g = data.get
+    sg = g("status", {}).get
+    status = HeartbeatStatus(sg("online"), sg("good", True))
+    return HeartbeatEvent(g("time", 0), g("self_id", 0), "heartbeat", status, g("interval", 0))
+
+
+_META_BUILDERS: Dict[str, _Builder] = {
+    "heartbeat": _build_heartbeat,
+    "lifecycle": _compile_builder(
+        LifeCycleEvent,
+        {"meta_event_type": "lifecycle"},
+        {"sub_type": ""},
+    ),
+}
+
+
 class EventFactory:
     """
     事件工厂类
+
+    各类事件按子类型查表得到构建函数，避免逐个比较字符串。
     """
 
     @staticmethod
@@ -37,321 +315,89 @@ class EventFactory:
         :raises ValueError: 如果事件类型未知
         """
         post_type = data.get("post_type")
-        
-        # 提取公共字段
-        common_args = {
-            "time": data.get("time", 0),
-            "self_id": data.get("self_id", 0),
-        }
-
-        if post_type == EventType.MESSAGE or post_type == EventType.MESSAGE_SENT:
-            return EventFactory._create_message_event(data, common_args)
-        elif post_type == EventType.NOTICE:
-            return EventFactory._create_notice_event(data, common_args)
-        elif post_type == EventType.REQUEST:
-            return EventFactory._create_request_event(data, common_args)
-        elif post_type == EventType.META:
-            return EventFactory._create_meta_event(data, common_args)
-        else:
+        create = _POST_TYPE_CREATORS.get(post_type)
+        if create is None:
             # 未知类型的事件，抛出异常
             raise ValueError(f"Unknown event type: {post_type}")
+        return create(data)
 
     @staticmethod
-    def _create_message_event(data: Dict[str, Any], common_args: Dict[str, Any]) -> OneBotEvent:
+    def create_events(items: Iterable[Dict[str, Any]]) -> List[OneBotEvent]:
+        """
+        根据数据批量创建事件对象，适用于一次上报多个事件的场景
+
+        :param items: 事件数据字典序列
+        :return: 与输入顺序一致的事件对象列表
+        :raises ValueError: 如果其中某个事件类型未知
+        """
+        creators = _POST_TYPE_CREATORS
+        events = []
+        for data in items:
+            post_type = data.get("post_type")
+            create = creators.get(post_type)
+            if create is None:
+                raise ValueError(f"Unknown event type: {post_type}")
+            events.append(create(data))
+        return events
+
+    @staticmethod
+    def _create_message_event(data: Dict[str, Any]) -> OneBotEvent:
         """
         创建消息事件
 
         :param data: 事件数据
-        :param common_args: 公共参数
         :return: 消息事件对象
+        :raises ValueError: 如果消息类型未知
         """
-        message_type = data.get("message_type")
-        
-        # 解析消息段
-        message_list = []
-        raw_message_list = data.get("message", [])
-        if isinstance(raw_message_list, list):
-            for item in raw_message_list:
-                if isinstance(item, dict):
-                    message_list.append(MessageSegment(type=item.get("type", ""), data=item.get("data", {})))
-        
-        # 解析发送者
-        sender_data = data.get("sender", {})
-        sender = Sender(
-            user_id=sender_data.get("user_id", 0),
-            nickname=sender_data.get("nickname", ""),
-            sex=sender_data.get("sex", "unknown"),
-            age=sender_data.get("age", 0),
-            card=sender_data.get("card"),
-            area=sender_data.get("area"),
-            level=sender_data.get("level"),
-            role=sender_data.get("role"),
-            title=sender_data.get("title"),
-        )
-
-        msg_args = {
-            **common_args,
-            "message_type": message_type,
-            "sub_type": data.get("sub_type", ""),
-            "message_id": data.get("message_id", 0),
-            "user_id": data.get("user_id", 0),
-            "message": message_list,
-            "raw_message": data.get("raw_message", ""),
-            "font": data.get("font", 0),
-            "sender": sender,
-        }
-
-        if message_type == "private":
-            return PrivateMessageEvent(**msg_args)
-        elif message_type == "group":
-            anonymous_data = data.get("anonymous")
-            anonymous = None
-            if anonymous_data:
-                anonymous = Anonymous(
-                    id=anonymous_data.get("id", 0),
-                    name=anonymous_data.get("name", ""),
-                    flag=anonymous_data.get("flag", "")
-                )
-            return GroupMessageEvent(
-                **msg_args,
-                group_id=data.get("group_id", 0),
-                anonymous=anonymous,
-            )
-        else:
-            # 未知消息类型，抛出异常
-            raise ValueError(f"Unknown message type: {message_type}")
+        return _build_message(data)
 
     @staticmethod
-    def _create_notice_event(data: Dict[str, Any], common_args: Dict[str, Any]) -> OneBotEvent:
+    def _create_notice_event(data: Dict[str, Any]) -> OneBotEvent:
         """
         创建通知事件
 
         :param data: 事件数据
-        :param common_args: 公共参数
-        :return: 通知事件对象
+        :return: 通知事件对象，未知通知类型返回基础通知事件
         """
         notice_type = data.get("notice_type", "")
-        
-        # 好友相关通知
-        if notice_type == "friend_add":
-            return FriendAddNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                user_id=data.get("user_id", 0)
-            )
-        elif notice_type == "friend_recall":
-            return FriendRecallNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                user_id=data.get("user_id", 0),
-                message_id=data.get("message_id", 0)
-            )
-        # 群相关通知
-        elif notice_type == "group_recall":
-            return GroupRecallNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                group_id=data.get("group_id", 0),
-                user_id=data.get("user_id", 0),
-                operator_id=data.get("operator_id", 0),
-                message_id=data.get("message_id", 0)
-            )
-        elif notice_type == "group_increase":
-            return GroupIncreaseNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                group_id=data.get("group_id", 0),
-                user_id=data.get("user_id", 0),
-                operator_id=data.get("operator_id", 0),
-                sub_type=data.get("sub_type", "")
-            )
-        elif notice_type == "group_decrease":
-            return GroupDecreaseNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                group_id=data.get("group_id", 0),
-                user_id=data.get("user_id", 0),
-                operator_id=data.get("operator_id", 0),
-                sub_type=data.get("sub_type", "")
-            )
-        elif notice_type == "group_admin":
-            return GroupAdminNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                group_id=data.get("group_id", 0),
-                user_id=data.get("user_id", 0),
-                sub_type=data.get("sub_type", "")
-            )
-        elif notice_type == "group_ban":
-            return GroupBanNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                group_id=data.get("group_id", 0),
-                user_id=data.get("user_id", 0),
-                operator_id=data.get("operator_id", 0),
-                duration=data.get("duration", 0),
-                sub_type=data.get("sub_type", "")
-            )
-        elif notice_type == "group_upload":
-            file_data = data.get("file", {})
-            file = GroupUploadFile(
-                id=file_data.get("id", ""),
-                name=file_data.get("name", ""),
-                size=file_data.get("size", 0),
-                busid=file_data.get("busid", 0)
-            )
-            return GroupUploadNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                group_id=data.get("group_id", 0),
-                user_id=data.get("user_id", 0),
-                file=file
-            )
-        elif notice_type == "notify":
-            sub_type = data.get("sub_type", "")
-            if sub_type == "poke":
-                return PokeNotifyEvent(
-                    **common_args,
-                    notice_type=notice_type,
-                    sub_type=sub_type,
-                    user_id=data.get("user_id", 0),
-                    target_id=data.get("target_id", 0),
-                    group_id=data.get("group_id", 0)
-                )
-            elif sub_type == "lucky_king":
-                return LuckyKingNotifyEvent(
-                    **common_args,
-                    notice_type=notice_type,
-                    sub_type=sub_type,
-                    user_id=data.get("user_id", 0),
-                    group_id=data.get("group_id", 0),
-                    target_id=data.get("target_id", 0)
-                )
-            elif sub_type == "honor":
-                return HonorNotifyEvent(
-                    **common_args,
-                    notice_type=notice_type,
-                    sub_type=sub_type,
-                    user_id=data.get("user_id", 0),
-                    group_id=data.get("group_id", 0),
-                    honor_type=data.get("honor_type", "")
-                )
-            else:
-                return NotifyNoticeEvent(
-                    **common_args,
-                    notice_type=notice_type,
-                    sub_type=sub_type,
-                    user_id=data.get("user_id", 0)
-                )
-        elif notice_type == "group_card":
-            return GroupCardNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                group_id=data.get("group_id", 0),
-                user_id=data.get("user_id", 0),
-                card_new=data.get("card_new", ""),
-                card_old=data.get("card_old", "")
-            )
-        elif notice_type == "offline_file":
-            file_data = data.get("file", {})
-            file = OfflineFile(
-                name=file_data.get("name", ""),
-                size=file_data.get("size", 0),
-                url=file_data.get("url", "")
-            )
-            return OfflineFileNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                user_id=data.get("user_id", 0),
-                file=file
-            )
-        elif notice_type == "client_status":
-            client_data = data.get("client", {})
-            client = ClientStatus(
-                online=client_data.get("online", False),
-                status=client_data.get("status", "")
-            )
-            return ClientStatusNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                client=client
-            )
-        elif notice_type == "essence":
-            return EssenceNoticeEvent(
-                **common_args,
-                notice_type=notice_type,
-                sub_type=data.get("sub_type", ""),
-                group_id=data.get("group_id", 0),
-                sender_id=data.get("sender_id", 0),
-                operator_id=data.get("operator_id", 0),
-                message_id=data.get("message_id", 0)
-            )
-        else:
-            # 未知通知类型，返回基础通知事件
-            return NoticeEvent(**common_args, notice_type=notice_type)
+        build = _NOTICE_BUILDERS.get(notice_type)
+        if build is None:
+            return NoticeEvent(data.get("time", 0), data.get("self_id", 0), notice_type)
+        return build(data)
 
     @staticmethod
-    def _create_request_event(data: Dict[str, Any], common_args: Dict[str, Any]) -> OneBotEvent:
+    def _create_request_event(data: Dict[str, Any]) -> OneBotEvent:
         """
         创建请求事件
 
         :param data: 事件数据
-        :param common_args: 公共参数
-        :return: 请求事件对象
+        :return: 请求事件对象，未知请求类型返回基础请求事件
         """
         request_type = data.get("request_type", "")
-        
-        if request_type == "friend":
-            return FriendRequestEvent(
-                **common_args,
-                request_type=request_type,
-                user_id=data.get("user_id", 0),
-                comment=data.get("comment", ""),
-                flag=data.get("flag", "")
-            )
-        elif request_type == "group":
-            return GroupRequestEvent(
-                **common_args,
-                request_type=request_type,
-                sub_type=data.get("sub_type", ""),
-                group_id=data.get("group_id", 0),
-                user_id=data.get("user_id", 0),
-                comment=data.get("comment", ""),
-                flag=data.get("flag", "")
-            )
-        else:
-            # 未知请求类型，返回基础请求事件
-            return RequestEvent(**common_args, request_type=request_type)
+        build = _REQUEST_BUILDERS.get(request_type)
+        if build is None:
+            return RequestEvent(data.get("time", 0), data.get("self_id", 0), request_type)
+        return build(data)
 
     @staticmethod
-    def _create_meta_event(data: Dict[str, Any], common_args: Dict[str, Any]) -> OneBotEvent:
+    def _create_meta_event(data: Dict[str, Any]) -> OneBotEvent:
         """
         创建元事件
 
         :param data: 事件数据
-        :param common_args: 公共参数
-        :return: 元事件对象
+        :return: 元事件对象，未知元事件类型返回基础元事件
         """
         meta_event_type = data.get("meta_event_type", "")
-        
-        if meta_event_type == "heartbeat":
-            status_data = data.get("status", {})
-            status = HeartbeatStatus(
-                online=status_data.get("online"),
-                good=status_data.get("good", True)
-            )
-            return HeartbeatEvent(
-                **common_args,
-                meta_event_type=meta_event_type,
-                status=status,
-                interval=data.get("interval", 0)
-            )
-        elif meta_event_type == "lifecycle":
-            return LifeCycleEvent(
-                **common_args,
-                meta_event_type=meta_event_type,
-                sub_type=data.get("sub_type", "")
-            )
-        else:
-            # 未知元事件类型，返回基础元事件
-            return MetaEvent(**common_args, meta_event_type=meta_event_type)
+        build = _META_BUILDERS.get(meta_event_type)
+        if build is None:
+            return MetaEvent(data.get("time", 0), data.get("self_id", 0), meta_event_type)
+        return build(data)
+
+
+_POST_TYPE_CREATORS: Dict[Any, _Builder] = {
+    EventType.MESSAGE: _build_message,
+    EventType.MESSAGE_SENT: _build_message,
+    EventType.NOTICE: EventFactory._create_notice_event,
+    EventType.REQUEST: EventFactory._create_request_event,
+    EventType.META: EventFactory._create_meta_event,
+}
@@ -3,8 +3,10 @@
 
 定义了消息相关的事件类，包括 MessageEvent, PrivateMessageEvent, GroupMessageEvent。
 """
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from core.permission_manager import ADMIN, OP, USER
 from models.message import MessageSegment
@@ -27,13 +29,16 @@ class Anonymous:
     """匿名用户 flag"""
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageEvent(OneBotEvent):
     """
     消息事件基类
     """
 
+    post_type: ClassVar[str] = EventType.MESSAGE
+
     # 权限级别常量，用于装饰器参数
+    # 未标注类型的类属性不是数据类字段，不占用实例槽位
     ADMIN = ADMIN
     OP = OP
     USER = USER
@@ -66,10 +71,6 @@ class MessageEvent(OneBotEvent):
     sender: Optional[Sender] = None
     """发送者信息"""
 
-    @property
-    def post_type(self) -> str:
-        return EventType.MESSAGE
-
     async def reply(self, message: str, auto_escape: bool = False):
         """
         回复消息（抽象方法，由子类实现）
@@ -80,7 +81,7 @@ class MessageEvent(OneBotEvent):
         raise NotImplementedError("reply method must be implemented by subclasses")
 
 
-@dataclass
+@dataclass(slots=True)
 class PrivateMessageEvent(MessageEvent):
     """
     私聊消息事件
@@ -98,7 +99,7 @@ class PrivateMessageEvent(MessageEvent):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupMessageEvent(MessageEvent):
     """
     群聊消息事件
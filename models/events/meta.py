@@ -3,8 +3,10 @@
 
 定义了元事件相关的事件类，包括心跳事件和生命周期事件。
 """
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import ClassVar, Optional
 from .base import OneBotEvent, EventType
 
 
@@ -26,21 +28,19 @@ class LifeCycleSubType:
     CONNECT = 'connect'  # 连接
 
 
-@dataclass
+@dataclass(slots=True)
 class MetaEvent(OneBotEvent):
     """
     元事件基类
     """
 
+    post_type: ClassVar[str] = EventType.META
+
     meta_event_type: str
     """元事件类型"""
 
-    @property
-    def post_type(self) -> str:
-        return EventType.META
 
-
-@dataclass
+@dataclass(slots=True)
 class HeartbeatEvent(MetaEvent):
     """
     心跳事件，用于确认连接状态
@@ -55,7 +55,7 @@ class HeartbeatEvent(MetaEvent):
     """心跳间隔时间(ms)"""
 
 
-@dataclass
+@dataclass(slots=True)
 class LifeCycleEvent(MetaEvent):
     """
     生命周期事件，用于通知框架生命周期变化
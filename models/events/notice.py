@@ -3,7 +3,11 @@
 
 定义了通知相关的事件类，包括好友通知和群组通知等。
 """
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import ClassVar, Dict, Optional, Type
+
 from .base import OneBotEvent, EventType
 
 
@@ -13,15 +17,13 @@ class NoticeEvent(OneBotEvent):
     通知事件基类
     """
 
+    post_type: ClassVar[str] = EventType.NOTICE
+
     notice_type: str
     """通知类型"""
 
-    @property
-    def post_type(self) -> str:
-        return EventType.NOTICE
-
 
-@dataclass
+@dataclass(slots=True)
 class FriendAddNoticeEvent(NoticeEvent):
     """
     好友添加通知
@@ -30,7 +32,7 @@ class FriendAddNoticeEvent(NoticeEvent):
     """新好友 QQ 号"""
 
 
-@dataclass
+@dataclass(slots=True)
 class FriendRecallNoticeEvent(NoticeEvent):
     """
     好友消息撤回通知
@@ -42,7 +44,7 @@ class FriendRecallNoticeEvent(NoticeEvent):
     """被撤回的消息 ID"""
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupNoticeEvent(NoticeEvent):
     """
     群组通知事件基类
@@ -54,7 +56,7 @@ class GroupNoticeEvent(NoticeEvent):
     """用户 QQ 号"""
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupRecallNoticeEvent(GroupNoticeEvent):
     """
     群消息撤回通知
@@ -66,7 +68,7 @@ class GroupRecallNoticeEvent(GroupNoticeEvent):
     """被撤回的消息 ID"""
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupIncreaseNoticeEvent(GroupNoticeEvent):
     """
     群成员增加通知
@@ -82,7 +84,7 @@ class GroupIncreaseNoticeEvent(GroupNoticeEvent):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupDecreaseNoticeEvent(GroupNoticeEvent):
     """
     群成员减少通知
@@ -100,7 +102,7 @@ class GroupDecreaseNoticeEvent(GroupNoticeEvent):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupAdminNoticeEvent(GroupNoticeEvent):
     """
     群管理员变动通知
@@ -113,7 +115,7 @@ class GroupAdminNoticeEvent(GroupNoticeEvent):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupBanNoticeEvent(GroupNoticeEvent):
     """
     群禁言通知
@@ -132,7 +134,7 @@ class GroupBanNoticeEvent(GroupNoticeEvent):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupUploadFile:
     """
     群文件信息
@@ -150,16 +152,16 @@ class GroupUploadFile:
     """文件总线 ID"""
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupUploadNoticeEvent(GroupNoticeEvent):
     """
     群文件上传通知
     """
-    file: GroupUploadFile = field(default_factory=GroupUploadFile)
+    file: Optional[GroupUploadFile] = None
     """文件信息"""
 
 
-@dataclass
+@dataclass(slots=True)
 class NotifyNoticeEvent(NoticeEvent):
     """
     系统通知事件基类 (notify)
@@ -175,7 +177,7 @@ class NotifyNoticeEvent(NoticeEvent):
     """发送者 QQ 号"""
 
 
-@dataclass
+@dataclass(slots=True)
 class PokeNotifyEvent(NotifyNoticeEvent):
     """
     戳一戳通知
@@ -187,7 +189,7 @@ class PokeNotifyEvent(NotifyNoticeEvent):
     """群号 (如果是群内戳一戳)"""
 
 
-@dataclass
+@dataclass(slots=True)
 class LuckyKingNotifyEvent(NotifyNoticeEvent):
     """
     群红包运气王通知
@@ -199,7 +201,7 @@ class LuckyKingNotifyEvent(NotifyNoticeEvent):
     """运气王 QQ 号"""
 
 
-@dataclass
+@dataclass(slots=True)
 class HonorNotifyEvent(NotifyNoticeEvent):
     """
     群荣誉变更通知
@@ -216,7 +218,7 @@ class HonorNotifyEvent(NotifyNoticeEvent):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupCardNoticeEvent(GroupNoticeEvent):
     """
     群成员名片更新通知
@@ -228,7 +230,7 @@ class GroupCardNoticeEvent(GroupNoticeEvent):
     """旧名片"""
 
 
-@dataclass
+@dataclass(slots=True)
 class OfflineFile:
     """
     离线文件信息
@@ -243,7 +245,7 @@ class OfflineFile:
     """下载链接"""
 
 
-@dataclass
+@dataclass(slots=True)
 class OfflineFileNoticeEvent(NoticeEvent):
     """
     接收离线文件通知
@@ -251,11 +253,11 @@ class OfflineFileNoticeEvent(NoticeEvent):
     user_id: int = 0
     """发送者 QQ 号"""
     
-    file: OfflineFile = field(default_factory=OfflineFile)
+    file: Optional[OfflineFile] = None
     """文件数据"""
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientStatus:
     """
     客户端状态
@@ -267,16 +269,16 @@ class ClientStatus:
     """状态描述"""
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientStatusNoticeEvent(NoticeEvent):
     """
     其他客户端在线状态变更通知
     """
-    client: ClientStatus = field(default_factory=ClientStatus)
+    client: Optional[ClientStatus] = None
     """客户端信息"""
 
 
-@dataclass
+@dataclass(slots=True)
 class EssenceNoticeEvent(GroupNoticeEvent):
     """
     精华消息变动通知
@@ -297,3 +299,27 @@ class EssenceNoticeEvent(GroupNoticeEvent):
     message_id: int = 0
     """消息 ID"""
 
+
+# 通知类型到事件类的映射，事件工厂据此按类型查表构建事件
+NOTICE_EVENT_CLASSES: Dict[str, Type[NoticeEvent]] = {
+    "friend_add": FriendAddNoticeEvent,
+    "friend_recall": FriendRecallNoticeEvent,
+    "group_recall": GroupRecallNoticeEvent,
+    "group_increase": GroupIncreaseNoticeEvent,
+    "group_decrease": GroupDecreaseNoticeEvent,
+    "group_admin": GroupAdminNoticeEvent,
+    "group_ban": GroupBanNoticeEvent,
+    "group_upload": GroupUploadNoticeEvent,
+    "notify": NotifyNoticeEvent,
+    "group_card": GroupCardNoticeEvent,
+    "offline_file": OfflineFileNoticeEvent,
+    "client_status": ClientStatusNoticeEvent,
+    "essence": EssenceNoticeEvent,
+}
+
+# notify 通知的子类型到事件类的映射，未列出的子类型使用 NotifyNoticeEvent
+NOTIFY_EVENT_CLASSES: Dict[str, Type[NotifyNoticeEvent]] = {
+    "poke": PokeNotifyEvent,
+    "lucky_king": LuckyKingNotifyEvent,
+    "honor": HonorNotifyEvent,
+}
@@ -3,7 +3,11 @@
 
 定义了请求相关的事件类。
 """
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import ClassVar, Dict, Type
+
 from .base import OneBotEvent, EventType
 
 
@@ -13,15 +17,13 @@ class RequestEvent(OneBotEvent):
     请求事件基类
     """
 
+    post_type: ClassVar[str] = EventType.REQUEST
+
     request_type: str
     """请求类型"""
 
-    @property
-    def post_type(self) -> str:
-        return EventType.REQUEST
-
 
-@dataclass
+@dataclass(slots=True)
 class FriendRequestEvent(RequestEvent):
     """
     加好友请求事件
@@ -36,7 +38,7 @@ class FriendRequestEvent(RequestEvent):
     """请求 flag，在调用处理请求的 API 时需要传入此 flag"""
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupRequestEvent(RequestEvent):
     """
     加群请求/邀请事件
@@ -59,3 +61,10 @@ class GroupRequestEvent(RequestEvent):
     
     flag: str = ""
     """请求 flag，在调用处理请求的 API 时需要传入此 flag"""
+
+
+# 请求类型到事件类的映射，事件工厂据此按类型查表构建事件
+REQUEST_EVENT_CLASSES: Dict[str, Type[RequestEvent]] = {
+    "friend": FriendRequestEvent,
+    "group": GroupRequestEvent,
+}
@@ -4,43 +4,126 @@
 该模块定义了 `MessageSegment` 类，用于构建和表示 OneBot v11 协议中的消息段。
 通过此类，可以方便地创建文本、图片、At 等不同类型的消息内容，并支持链式操作。
 """
+from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Dict
 
+# 常用消息段类型的驻留字符串，MessageSegment 会把 type 驻留，类型判断只需比较引用
+_TEXT = sys.intern("text")
+_IMAGE = sys.intern("image")
+_AT = sys.intern("at")
+_FACE = sys.intern("face")
+
+# 没有数据的消息段共享同一个空映射
+_EMPTY_DATA = MappingProxyType({})
+
 
-@dataclass(slots=True)
 class MessageSegment:
     """
     表示一个 OneBot v11 消息段。
 
+    消息段是不可变的值对象：构造后不能修改属性，data 会被复制并包装为只读映射
+    （传入的已经是只读映射时直接使用，不再复制）。
+    因此消息段可以哈希、放入集合去重，也可以在多条消息之间安全共享。
+
     Attributes:
         type (str): 消息段的类型，例如 'text', 'image', 'at'。
-        data (Dict[str, Any]): 消息段的具体数据，是一个键值对字典。
+        data (Mapping[str, Any]): 消息段的具体数据，是一个只读的键值对映射。
     """
 
-    type: str
-    data: Dict[str, Any]
+    # 每条消息的每个消息段都会构造一次，因此手写 __init__ 而不使用 dataclass 生成的版本
+    __slots__ = ("type", "data", "_cached_dict", "_hash")
+
+    def __init__(self, type: str, data: Dict[str, Any]):
+        set_ = object.__setattr__
+        # 驻留类型字符串，使 get_text/get_image_url/is_at 可以用 `is` 判断类型
+        set_(self, "type", sys.intern(type) if type.__class__ is str else type)
+        if data.__class__ is MappingProxyType:
+            proxy = data
+        elif data:
+            # 复制一份再包装，调用方之后修改自己的字典不会影响消息段
+            proxy = MappingProxyType(dict(data))
+        else:
+            proxy = _EMPTY_DATA
+        set_(self, "data", proxy)
+        # 发送时使用的字典形式缓存，见 `to_dict`
+        set_(self, "_cached_dict", None)
+        set_(self, "_hash", None)
+
+    @classmethod
+    def _from_event(cls, type: Any, data: Any) -> "MessageSegment":
+        """
+        由事件工厂调用，从上报的原始消息段构造。
+
+        data 是刚解析出来、没有其他引用的字典，因此直接包装而不复制；
+        data 缺失或不是字典（实现端上报的畸形消息段）时按空数据处理。
+        """
+        self = cls.__new__(cls)
+        set_ = object.__setattr__
+        set_(self, "type", sys.intern(type) if type.__class__ is str else type)
+        set_(self, "data", MappingProxyType(data) if data.__class__ is dict else _EMPTY_DATA)
+        set_(self, "_cached_dict", None)
+        set_(self, "_hash", None)
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"MessageSegment 不可变，不能修改属性 {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"MessageSegment 不可变，不能删除属性 {name}")
+
+    def __reduce__(self):
+        # MappingProxyType 无法序列化，pickle/copy 时使用普通字典重新构造
+        return (MessageSegment, (self.type, dict(self.data)))
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.type == other.type and self.data == other.data
+
+    def __hash__(self):
+        h = self._hash
+        if h is None:
+            # data 中含有不可哈希的值（如列表）时，与元组一样抛出 TypeError
+            h = hash((self.type, frozenset(self.data.items())))
+            object.__setattr__(self, "_hash", h)
+        return h
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        转换为符合 OneBot 规范的消息段字典。
+
+        转换结果会缓存在消息段上，重复发送同一个消息段时直接复用。
+
+        Returns:
+            Dict[str, Any]: 形如 {"type": ..., "data": {...}} 的字典。
+        """
+        cached = self._cached_dict
+        if cached is None:
+            cached = {"type": self.type, "data": dict(self.data)}
+            object.__setattr__(self, "_cached_dict", cached)
+        return cached
 
-    @property
-    def text(self) -> str:
+    def get_text(self) -> str:
         """
         当消息段类型为 'text' 时，快速获取其文本内容。
 
         Returns:
             str: 消息段的文本内容。如果类型不是 'text'，则返回空字符串。
         """
-        return self.data.get("text", "") if self.type == "text" else ""
+        return self.data.get("text", "") if self.type is _TEXT else ""
 
-    @property
-    def image_url(self) -> str:
+    def get_image_url(self) -> str:
         """
         当消息段类型为 'image' 时，快速获取其图片 URL。
 
         Returns:
             str: 图片的 URL。如果类型不是 'image' 或数据中不含 'url'，则返回空字符串。
         """
-        return self.data.get("url", "") if self.type == "image" else ""
+        return self.data.get("url", "") if self.type is _IMAGE else ""
 
     def is_at(self, user_id: int = None) -> bool:
         """
@@ -53,7 +136,7 @@ class MessageSegment:
         Returns:
             bool: 如果消息段是 'at' 类型且 user_id 匹配 (如果提供)，则返回 True。
         """
-        if self.type != "at":
+        if self.type is not _AT:
             return False
         if user_id is None:
             return True
@@ -68,7 +151,7 @@ class MessageSegment:
     # --- 快捷构造方法 ---
 
     @staticmethod
-    def text(text: str) -> "MessageSegment":  # noqa: F811
+    def text(text: str) -> "MessageSegment":
         """
         创建一个文本消息段。
 
@@ -78,7 +161,7 @@ class MessageSegment:
         Returns:
             MessageSegment: 一个类型为 'text' 的消息段对象。
         """
-        return MessageSegment(type="text", data={"text": text})
+        return MessageSegment(type=_TEXT, data={"text": text})
 
     @staticmethod
     def at(user_id: int | str) -> "MessageSegment":
@@ -89,9 +172,9 @@ class MessageSegment:
             user_id (int | str): 要提及的 QQ 号。若为 "all"，则表示 @全体成员。
 
         Returns:
-            MessageSegment: 一个类型为 'at' 的消息段对象。
+            MessageSegment: 一个类型为 'at' 的消息段对象。相同 QQ 号返回同一个共享对象。
         """
-        return MessageSegment(type="at", data={"qq": str(user_id)})
+        return _at_cached(str(user_id))
 
     @staticmethod
     def image(file: str) -> "MessageSegment":
@@ -104,7 +187,7 @@ class MessageSegment:
         Returns:
             MessageSegment: 一个类型为 'image' 的消息段对象。
         """
-        return MessageSegment(type="image", data={"file": file})
+        return MessageSegment(type=_IMAGE, data={"file": file})
 
     @staticmethod
     def face(id: int) -> "MessageSegment":
@@ -115,7 +198,19 @@ class MessageSegment:
             id (int): QQ 表情的 ID。
 
         Returns:
-            MessageSegment: 一个类型为 'face' 的消息段对象。
+            MessageSegment: 一个类型为 'face' 的消息段对象。相同表情 ID 返回同一个共享对象。
         """
-        return MessageSegment(type="face", data={"id": str(id)})
+        return _face_cached(str(id))
+
+
+# --- 常用消息段缓存 ---
+# at、face 消息段的内容只由一个 ID 决定，且会被反复构造，因此缓存并共享同一个对象。
+
+@lru_cache(maxsize=256)
+def _at_cached(qq: str) -> MessageSegment:
+    return MessageSegment(type=_AT, data={"qq": qq})
+
 
+@lru_cache(maxsize=256)
+def _face_cached(id_: str) -> MessageSegment:
+    return MessageSegment(type=_FACE, data={"id": id_})
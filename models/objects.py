@@ -3,8 +3,11 @@ API 响应数据模型模块
 
 定义了 API 返回的数据结构。
 """
-from dataclasses import dataclass, field
-from typing import List, Optional
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 
 @dataclass(slots=True)
@@ -25,7 +28,7 @@ class GroupInfo:
     """最大成员数"""
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupMemberInfo:
     """
     群成员信息
@@ -76,7 +79,103 @@ class GroupMemberInfo:
     """是否允许修改群名片"""
 
 
-@dataclass
+# GroupMemberTable 中 role_code 列使用的角色编码，数值越小权限越高
+ROLE_OWNER = 0
+ROLE_ADMIN = 1
+ROLE_MEMBER = 2
+_ROLE_CODES = {"owner": ROLE_OWNER, "admin": ROLE_ADMIN, "member": ROLE_MEMBER}
+
+
+class GroupMemberTable:
+    """
+    按列存储的群成员列表
+
+    成员列表只用于筛选、统计时，按列存储比逐个创建 `GroupMemberInfo` 更省内存，
+    遍历单个字段时也只需访问一段连续的数据。整数字段使用 `array('q')` 存储，
+    角色另以 `array('b')` 编码为 `role_code` 列（见 `ROLE_OWNER` 等常量），各列按下标一一对应。
+    """
+
+    __slots__ = ("user_id", "join_time", "last_sent_time", "role", "role_code", "nickname", "card")
+
+    def __init__(
+        self,
+        user_id: array,
+        join_time: array,
+        last_sent_time: array,
+        role: List[str],
+        nickname: List[str],
+        card: List[str],
+    ):
+        self.user_id = user_id
+        self.join_time = join_time
+        self.last_sent_time = last_sent_time
+        self.role = role
+        self.role_code = array("b", [_ROLE_CODES.get(r, ROLE_MEMBER) for r in role])
+        self.nickname = nickname
+        self.card = card
+
+    @classmethod
+    def from_dicts(cls, items: Sequence[Dict[str, Any]]) -> "GroupMemberTable":
+        """
+        从 API 返回的原始成员字典列表构建
+
+        :param items: `get_group_member_list` 返回的原始数据
+        :return: 群成员表
+        """
+        return cls(
+            array("q", [item.get("user_id", 0) for item in items]),
+            array("q", [item.get("join_time", 0) for item in items]),
+            array("q", [item.get("last_sent_time", 0) for item in items]),
+            [item.get("role", "member") for item in items],
+            [item.get("nickname", "") for item in items],
+            [item.get("card", "") for item in items],
+        )
+
+    @classmethod
+    def from_list(cls, members: Iterable[GroupMemberInfo]) -> "GroupMemberTable":
+        """
+        从 `GroupMemberInfo` 列表构建
+
+        :param members: 群成员信息对象
+        :return: 群成员表
+        """
+        members = list(members)
+        return cls(
+            array("q", [m.user_id for m in members]),
+            array("q", [m.join_time for m in members]),
+            array("q", [m.last_sent_time for m in members]),
+            [m.role for m in members],
+            [m.nickname for m in members],
+            [m.card for m in members],
+        )
+
+    def __len__(self) -> int:
+        return len(self.user_id)
+
+    def filter_by_role(self, role: str) -> array:
+        """
+        获取指定角色的所有成员 QQ 号
+
+        :param role: owner、admin 或 member
+        :return: 成员 QQ 号数组
+        """
+        return array("q", [uid for uid, r in zip(self.user_id, self.role) if r == role])
+
+    def count_active_admins(self, cutoff: int) -> int:
+        """
+        统计在指定时间之后发过言的群主和管理员数量
+
+        :param cutoff: 时间戳，最后发言时间不早于此值的成员视为活跃
+        :return: 活跃的群主和管理员数量
+        """
+        count = 0
+        for code, last_sent in zip(self.role_code, self.last_sent_time):
+            if code <= ROLE_ADMIN and last_sent >= cutoff:
+                count += 1
+        return count
+
+
+@dataclass(slots=True)
 class FriendInfo:
     """
     好友信息
@@ -91,7 +190,7 @@ class FriendInfo:
     """备注"""
 
 
-@dataclass
+@dataclass(slots=True)
 class StrangerInfo:
     """
     陌生人信息
@@ -109,7 +208,7 @@ class StrangerInfo:
     """年龄"""
 
 
-@dataclass
+@dataclass(slots=True)
 class LoginInfo:
     """
     登录号信息
@@ -121,7 +220,7 @@ class LoginInfo:
     """昵称"""
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionInfo:
     """
     版本信息
@@ -136,7 +235,7 @@ class VersionInfo:
     """OneBot 标准版本"""
 
 
-@dataclass
+@dataclass(slots=True)
 class Status:
     """
     运行状态
@@ -148,7 +247,7 @@ class Status:
     """运行状态是否良好"""
 
 
-@dataclass
+@dataclass(slots=True)
 class EssenceMessage:
     """
     精华消息
@@ -175,7 +274,7 @@ class EssenceMessage:
     """消息 ID"""
 
 
-@dataclass
+@dataclass(slots=True)
 class CurrentTalkative:
     """
     龙王信息
@@ -193,7 +292,7 @@ class CurrentTalkative:
     """持续天数"""
 
 
-@dataclass
+@dataclass(slots=True)
 class HonorInfo:
     """
     荣誉信息
@@ -211,10 +310,12 @@ class HonorInfo:
     """荣誉描述"""
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupHonorInfo:
     """
     群荣誉信息
+
+    未返回的荣誉列表默认为共享的空元组，不为每个对象分配空列表。
     """
     group_id: int = 0
     """群号"""
@@ -222,17 +323,17 @@ class GroupHonorInfo:
     current_talkative: Optional[CurrentTalkative] = None
     """当前龙王"""
     
-    talkative_list: List[HonorInfo] = field(default_factory=list)
+    talkative_list: Sequence[HonorInfo] = ()
     """历史龙王"""
     
-    performer_list: List[HonorInfo] = field(default_factory=list)
+    performer_list: Sequence[HonorInfo] = ()
     """群聊之火"""
     
-    legend_list: List[HonorInfo] = field(default_factory=list)
+    legend_list: Sequence[HonorInfo] = ()
     """群聊炽焰"""
     
-    strong_newbie_list: List[HonorInfo] = field(default_factory=list)
+    strong_newbie_list: Sequence[HonorInfo] = ()
     """冒尖小春笋"""
     
-    emotion_list: List[HonorInfo] = field(default_factory=list)
+    emotion_list: Sequence[HonorInfo] = ()
     """快乐源泉"""
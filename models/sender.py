@@ -3,14 +3,18 @@
 
 定义了 Sender 类，用于封装 OneBot 11 的发送者信息。
 """
+from __future__ import annotations
+
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Sender:
     """
     发送者信息类，对应 OneBot 11 标准中的 sender 字段
+
+    实例不可变，字段相同的发送者会在多个事件之间共享同一个对象。
     """
 
     user_id: int
@@ -40,19 +40,18 @@ async def handle_admin_command(bot: Bot, event: MessageEvent, args: list[str]):
             await event.reply("当前没有设置任何管理员。")
             return
         
-        admin_list_str = "\n".join(str(admin_id) for admin_id in admins)
+        admin_list_str = await admin_manager.get_rendered_list()
         await event.reply(f"当前管理员列表 ({len(admins)}):\n{admin_list_str}")
         return
 
     if action in ("add", "remove"):
-        if len(args) < 2 or not args[1].isdigit():
-            await event.reply("参数错误，请提供一个有效的 QQ 号。\n示例: /admin add 123456")
-            return
-
         try:
             user_id = int(args[1])
-        except ValueError:
-            await event.reply("无效的 QQ 号，请输入纯数字。")
+        except (IndexError, ValueError):
+            user_id = 0
+        # int() 也接受 "-1"、"+1" 等写法，因此还需检查数值范围
+        if user_id <= 0:
+            await event.reply("参数错误，请提供一个有效的 QQ 号。\n示例: /admin add 123456")
             return
 
         if action == "add":
@@ -14,18 +14,15 @@ __plugin_meta__ = {
 }
 
 @matcher.command("echo")
-async def handle_echo(bot: Bot, event: MessageEvent, args: list[str]):
+async def handle_echo(bot: Bot, event: MessageEvent, raw_args: str):
     """
     处理 echo 指令，原样回复用户输入的内容
 
     :param bot: Bot 实例
     :param event: 消息事件对象
-    :param args: 指令参数列表
+    :param raw_args: 指令名之后的原始文本
     """
-    if not args:
-        reply_msg = "请在指令后输入要回复的内容，例如：/echo 你好"
-    else:
-        reply_msg = " ".join(args)
+    reply_msg = raw_args or "请在指令后输入要回复的内容，例如：/echo 你好"
 
     await event.reply(reply_msg)
 
@@ -46,9 +43,9 @@ async def handle_poke(bot: Bot, event: MessageEvent, permission_granted: bool):
         await event.reply("只有我的操作员才能让我点赞哦！(｡•ˇ‸ˇ•｡)")
         return
 
-    try:
-        # 尝试发送赞
-        await bot.send_like(event.user_id, times=10)
-        await event.reply("好感度+10！(〃'▽'〃)")
-    except Exception as e:
-        await event.reply(f"点赞失败了 >_<: {str(e)}")
\ No newline at end of file
+    ok, err = await bot.send_like(event.user_id, times=10)
+    if not ok:
+        await event.reply(f"点赞失败了 >_<: {err}")
+        return
+
+    await event.reply("好感度+10！(〃'▽'〃)")
\ No newline at end of file